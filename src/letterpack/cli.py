@@ -72,8 +72,16 @@ def interactive_input() -> tuple[AddressInfo, AddressInfo, str]:
     return to_info, from_info, output
 
 
-def main():
-    """CLIのメインエントリーポイント"""
+def main(argv: list[str] | None = None) -> int:
+    """
+    CLIのメインエントリーポイント
+
+    Args:
+        argv: コマンドライン引数（Noneの場合はsys.argvを使用。テストからプロセス内で呼び出す場合に指定）
+
+    Returns:
+        終了コード（0: 成功、1: エラー）
+    """
     parser = argparse.ArgumentParser(
         description="レターパック用のラベルPDFを生成します",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -135,7 +143,7 @@ def main():
         help="ヘッダーとサンプル行を含むCSVを標準出力に出力",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         # サンプルCSV出力モード
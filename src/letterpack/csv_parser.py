@@ -2,12 +2,69 @@
 CSVファイルからレターパック情報を読み込むモジュール
 """
 
+import codecs
 import csv
+import io
+import mmap
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import NamedTuple
+from typing import BinaryIO, NamedTuple
 
 from .label import AddressInfo
 
+# 必須カラムと任意カラムの定義
+REQUIRED_COLUMNS = frozenset(
+    {
+        "to_postal",
+        "to_address1",
+        "to_name",
+        "from_postal",
+        "from_address1",
+        "from_name",
+    }
+)
+OPTIONAL_COLUMNS = frozenset(
+    {
+        "to_address2",
+        "to_address3",
+        "to_phone",
+        "to_honorific",
+        "from_address2",
+        "from_address3",
+        "from_phone",
+        "from_honorific",
+    }
+)
+
+
+# エンコーディング判定に使う先頭のバイト数
+ENCODING_SAMPLE_SIZE = 4096
+
+# このサイズ以上のCSVファイルはmmapで読み込む
+MMAP_THRESHOLD = 64 * 1024
+
+# 1セクション分のカラム（AddressInfoのフィールド順: 郵便番号, 住所1-3, 氏名, 電話番号, 敬称）
+_TO_COLUMNS = (
+    "to_postal",
+    "to_address1",
+    "to_address2",
+    "to_address3",
+    "to_name",
+    "to_phone",
+    "to_honorific",
+)
+_FROM_COLUMNS = (
+    "from_postal",
+    "from_address1",
+    "from_address2",
+    "from_address3",
+    "from_name",
+    "from_phone",
+    "from_honorific",
+)
+
 
 class LabelData(NamedTuple):
     """1件分のラベルデータ（お届け先とご依頼主のペア）"""
@@ -26,6 +83,93 @@ class CSVValidationError(Exception):
         super().__init__(f"行 {row_number}, フィールド '{field}': {message}")
 
 
+def _normalize_row(row: dict[str, str], columns: tuple[str, ...]) -> list[str]:
+    """
+    1行分のセクションの値を取り出して前後の空白を除去する
+
+    Args:
+        row: csv.DictReaderが返す1行分の辞書
+        columns: 取り出すカラム名（_TO_COLUMNS または _FROM_COLUMNS）
+
+    Returns:
+        columnsと同じ順序の値のリスト（カラムがない場合は空文字列）
+    """
+    return [row.get(column, "").strip() for column in columns]
+
+
+def _detect_encoding(f: BinaryIO) -> str:
+    """
+    ファイル先頭のサンプルからエンコーディングを判定する
+
+    ファイル全体を読み込まず、先頭の数KBだけをインクリメンタルデコーダで検証する。
+    判定後はファイル位置を先頭に戻す。
+
+    Args:
+        f: バイナリモードで開いたファイルオブジェクト
+
+    Returns:
+        "utf-8-sig"、"utf-8" または "shift_jis"
+    """
+    sample = f.read(ENCODING_SAMPLE_SIZE)
+    f.seek(0)
+
+    # BOM付きUTF-8（Excelで保存したCSVなど）はBOMを除去して読み込む
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        # サンプル末尾で途切れたマルチバイト文字はエラーにしない（ファイル末尾の場合を除く）
+        decoder.decode(sample, final=len(sample) < ENCODING_SAMPLE_SIZE)
+    except UnicodeDecodeError:
+        return "shift_jis"
+    return "utf-8"
+
+
+class _MmapReader(io.RawIOBase):
+    """mmapを読み取り専用のバイナリストリームとして扱うアダプタ（TextIOWrapperに渡すため）"""
+
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._mm.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+
+@contextmanager
+def _open_csv_text(raw: BinaryIO, encoding: str) -> Iterator[Iterable[str]]:
+    """
+    バイナリモードのファイルを文字列の行として読み込む
+
+    MMAP_THRESHOLD以上のファイルはmmapでマップし、OSへ必要な分だけページインさせる。
+    小さいファイルはmmapの準備コストの方が大きいため、ファイルを直接読み込む。
+    どちらの場合もcsvモジュールの推奨どおりnewline=""で開き、改行コードの扱い
+    （CRのみの改行や引用符内のCRLF）をファイルサイズによらず揃える。
+
+    Args:
+        raw: バイナリモードで開いたファイルオブジェクト
+        encoding: 文字エンコーディング
+
+    Yields:
+        csv.DictReaderに渡せる文字列の行のイテラブル
+    """
+    if os.fstat(raw.fileno()).st_size < MMAP_THRESHOLD:
+        with io.TextIOWrapper(raw, encoding=encoding, newline="") as f:
+            yield f
+        return
+
+    with (
+        mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        io.TextIOWrapper(io.BufferedReader(_MmapReader(mm)), encoding=encoding, newline="") as f,
+    ):
+        yield f
+
+
 def _parse_csv_reader(
     reader: csv.DictReader,
     required_columns: set[str],
@@ -63,24 +207,22 @@ def _parse_csv_reader(
     for row_number, row in enumerate(reader, start=2):  # ヘッダーが1行目なので2から開始
         try:
             # お届け先
-            to_postal = row.get("to_postal", "").strip()
-            to_address1 = row.get("to_address1", "").strip()
-            to_address2 = row.get("to_address2", "").strip() or None
-            to_address3 = row.get("to_address3", "").strip() or None
-            to_name = row.get("to_name", "").strip()
-            to_phone = row.get("to_phone", "").strip() or None
-            to_honorific = row.get("to_honorific", "").strip()
+            to_postal, to_address1, to_address2, to_address3, to_name, to_phone, to_honorific = (
+                _normalize_row(row, _TO_COLUMNS)
+            )
             if not to_honorific:
                 to_honorific = "様"  # デフォルト
 
             # ご依頼主
-            from_postal = row.get("from_postal", "").strip()
-            from_address1 = row.get("from_address1", "").strip()
-            from_address2 = row.get("from_address2", "").strip() or None
-            from_address3 = row.get("from_address3", "").strip() or None
-            from_name = row.get("from_name", "").strip()
-            from_phone = row.get("from_phone", "").strip() or None
-            from_honorific = row.get("from_honorific", "").strip()
+            (
+                from_postal,
+                from_address1,
+                from_address2,
+                from_address3,
+                from_name,
+                from_phone,
+                from_honorific,
+            ) = _normalize_row(row, _FROM_COLUMNS)
             # from_honorificは空文字列でもOK（敬称なし）
 
             # AddressInfoを作成（バリデーション含む）
@@ -88,10 +230,10 @@ def _parse_csv_reader(
                 to_info = AddressInfo(
                     postal_code=to_postal,
                     address1=to_address1,
-                    address2=to_address2,
-                    address3=to_address3,
+                    address2=to_address2 or None,
+                    address3=to_address3 or None,
                     name=to_name,
-                    phone=to_phone,
+                    phone=to_phone or None,
                     honorific=to_honorific,
                 )
             except ValueError as e:
@@ -102,10 +244,10 @@ def _parse_csv_reader(
                 from_info = AddressInfo(
                     postal_code=from_postal,
                     address1=from_address1,
-                    address2=from_address2,
-                    address3=from_address3,
+                    address2=from_address2 or None,
+                    address3=from_address3 or None,
                     name=from_name,
-                    phone=from_phone,
+                    phone=from_phone or None,
                     honorific=from_honorific,
                 )
             except ValueError as e:
@@ -146,44 +288,40 @@ def parse_csv(csv_path: str) -> list[LabelData]:
     if not csv_file.exists():
         raise FileNotFoundError(f"CSVファイルが見つかりません: {csv_path}")
 
-    # 必須カラムと任意カラムの定義
-    required_columns = {
-        "to_postal",
-        "to_address1",
-        "to_name",
-        "from_postal",
-        "from_address1",
-        "from_name",
-    }
-    optional_columns = {
-        "to_address2",
-        "to_address3",
-        "to_phone",
-        "to_honorific",
-        "from_address2",
-        "from_address3",
-        "from_phone",
-        "from_honorific",
-    }
+    required_columns = set(REQUIRED_COLUMNS)
+    optional_columns = set(OPTIONAL_COLUMNS)
 
     labels = []
     errors = []
 
+    encoding = None
     try:
-        with open(csv_file, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            labels, errors = _parse_csv_reader(reader, required_columns, optional_columns)
+        # 先頭のサンプルでエンコーディングを判定し、同じファイルハンドルのまま1回で読み込む
+        with open(csv_file, "rb") as raw:
+            encoding = _detect_encoding(raw)
+            with _open_csv_text(raw, encoding) as f:
+                reader = csv.DictReader(f)
+                labels, errors = _parse_csv_reader(reader, required_columns, optional_columns)
 
-    except UnicodeDecodeError:
-        # UTF-8で読めない場合はShift_JISを試す
+    except UnicodeDecodeError as e:
+        if encoding == "shift_jis":
+            raise ValueError(f"CSVファイルの読み込みに失敗しました: {e}") from e
+
+        # サンプル以降にUTF-8として不正なバイト列があった場合はShift_JISを試す
         try:
-            with open(csv_file, encoding="shift_jis") as f:
+            with open(csv_file, encoding="shift_jis", newline="") as f:
                 reader = csv.DictReader(f)
                 labels, errors = _parse_csv_reader(reader, required_columns, optional_columns)
 
         except Exception as e:
             raise ValueError(f"CSVファイルの読み込みに失敗しました: {e}") from e
 
+    except Exception as e:
+        # Shift_JISとして読み込んだ場合の失敗は、フォールバック時と同じく読み込みエラーとして扱う
+        if encoding != "shift_jis":
+            raise
+        raise ValueError(f"CSVファイルの読み込みに失敗しました: {e}") from e
+
     # エラーがあれば詳細を表示して例外を投げる
     if errors:
         error_messages = [f"  行 {row}: [{section}] {msg}" for row, section, msg in errors]
@@ -196,16 +334,74 @@ def parse_csv(csv_path: str) -> list[LabelData]:
     return labels
 
 
+def _validate_csv_fast(csv_path: str) -> int | None:
+    """
+    pyarrowを使った検証専用の高速パス
+
+    行ごとのPythonオブジェクトを作らず、ネイティブの1パスで必須カラムと
+    必須セルを確認する。pyarrowは任意依存のため、未インストールの場合は何もしない。
+
+    Args:
+        csv_path: CSVファイルのパス
+
+    Returns:
+        全行が有効と確認できた場合はレコード数。
+        pyarrowが利用できない場合や問題が見つかった場合はNone
+        （詳細なエラーメッセージはparse_csvで生成する）
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+
+    try:
+        with open(csv_path, "rb") as f:
+            encoding = _detect_encoding(f)
+
+        table = pa_csv.read_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(encoding=encoding),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=False),
+            # 検証に必要な必須カラムのみを変換する（必須カラムが欠けている場合はエラー）
+            convert_options=pa_csv.ConvertOptions(
+                column_types=dict.fromkeys(REQUIRED_COLUMNS, pa.string()),
+                include_columns=sorted(REQUIRED_COLUMNS),
+                strings_can_be_null=False,
+            ),
+        )
+    except (OSError, pa.ArrowException):
+        return None
+
+    if table.num_rows == 0:
+        return None
+
+    # 空白のみのセルも未入力として扱う（AddressInfoのバリデーションと同じ基準）
+    for column in table.columns:
+        if pc.min(pc.utf8_length(pc.utf8_trim_whitespace(column))).as_py() == 0:
+            return None
+
+    return table.num_rows
+
+
 def validate_csv(csv_path: str) -> tuple[bool, str | None, int]:
     """
     CSVファイルを検証（PDF生成前のチェック用）
 
+    pyarrowがインストールされている場合は高速パスで検証し、
+    問題が見つかった場合のみparse_csvで詳細なエラーメッセージを生成する
+
     Args:
         csv_path: CSVファイルのパス
 
     Returns:
         (成功/失敗, エラーメッセージ, 有効なレコード数) のタプル
     """
+    row_count = _validate_csv_fast(csv_path)
+    if row_count is not None:
+        return (True, None, row_count)
+
     try:
         labels = parse_csv(csv_path)
         return (True, None, len(labels))
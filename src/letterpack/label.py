@@ -2,24 +2,31 @@
 レターパックラベル生成のコアロジック
 """
 
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import io
+import json
 import os
+import tempfile
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-import yaml
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.cidfonts import UnicodeCIDFont
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfgen import canvas
+
+# reportlabのPDF生成・フォント関連モジュールとyamlは読み込みに時間がかかるため、
+# 使用する関数内でインポートする（CSVの検証やCLIのヘルプ表示だけなら読み込まない）
+if TYPE_CHECKING:
+    from reportlab.pdfgen import canvas
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AddressInfo:
-    """住所情報を保持するデータクラス"""
+    """住所情報を保持するデータクラス（不変。大量生成時のメモリを抑えるため__slots__を使用）"""
 
     postal_code: str  # 郵便番号（例: "123-4567"）
     address1: str  # 住所1行目（必須）
@@ -42,7 +49,17 @@ class AddressInfo:
 # レイアウト設定のPydanticモデル
 
 
-class LayoutConfig(BaseModel):
+class _FrozenModel(BaseModel):
+    """
+    不変のレイアウト設定モデルの基底クラス
+
+    検証済みの設定をキャッシュして複数のLabelGeneratorで共有するため、変更を禁止する
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class LayoutConfig(_FrozenModel):
     """ラベルの基本寸法設定"""
 
     label_width: float = Field(default=105, gt=0, le=300, description="ラベルの幅 (mm)")
@@ -62,7 +79,7 @@ class LayoutConfig(BaseModel):
     )
 
 
-class FontsConfig(BaseModel):
+class FontsConfig(_FrozenModel):
     """フォントサイズ設定"""
 
     label: int = Field(default=9, gt=0, le=72, description="フィールドラベルのフォントサイズ (pt)")
@@ -78,7 +95,7 @@ class FontsConfig(BaseModel):
     phone: int = Field(default=13, gt=0, le=72, description="電話番号のフォントサイズ (pt)")
 
 
-class SpacingConfig(BaseModel):
+class SpacingConfig(_FrozenModel):
     """要素間のスペーシング設定"""
 
     section_spacing: int = Field(default=15, ge=0, le=100, description="セクション間の間隔 (px)")
@@ -100,7 +117,7 @@ class SpacingConfig(BaseModel):
     )
 
 
-class PostalBoxConfig(BaseModel):
+class PostalBoxConfig(_FrozenModel):
     """郵便番号ボックス設定"""
 
     box_size: float = Field(default=5, gt=0, le=20, description="ボックスのサイズ (mm)")
@@ -111,14 +128,14 @@ class PostalBoxConfig(BaseModel):
     )
 
 
-class AddressLayoutConfig(BaseModel):
+class AddressLayoutConfig(_FrozenModel):
     """住所レイアウト設定"""
 
     max_length: int = Field(default=35, gt=0, le=100, description="1行の最大文字数")
     max_lines: int = Field(default=3, gt=0, le=10, description="最大行数")
 
 
-class DottedLineConfig(BaseModel):
+class DottedLineConfig(_FrozenModel):
     """点線スタイル設定"""
 
     dash_length: float = Field(default=2, gt=0, le=10, description="線の長さ (mm)")
@@ -128,14 +145,14 @@ class DottedLineConfig(BaseModel):
     color_b: float = Field(default=0.5, ge=0, le=1, description="RGB の B 値")
 
 
-class SamaConfig(BaseModel):
+class SamaConfig(_FrozenModel):
     """「様」の配置設定"""
 
     width: float = Field(default=8, gt=0, le=50, description="「様」用のスペース (mm)")
     offset: float = Field(default=2, ge=0, le=20, description="点線からのオフセット (mm)")
 
 
-class BorderConfig(BaseModel):
+class BorderConfig(_FrozenModel):
     """枠線スタイル設定（デバッグ用）"""
 
     color_r: float = Field(default=0.8, ge=0, le=1, description="RGB の R 値")
@@ -144,13 +161,13 @@ class BorderConfig(BaseModel):
     line_width: float = Field(default=0.5, gt=0, le=10, description="線の幅")
 
 
-class PhoneConfig(BaseModel):
+class PhoneConfig(_FrozenModel):
     """電話番号の配置設定"""
 
     offset_x: int = Field(default=30, ge=0, le=200, description="電話番号の左からのオフセット (px)")
 
 
-class SectionHeightConfig(BaseModel):
+class SectionHeightConfig(_FrozenModel):
     """セクション高さ設定（実測値ベース）"""
 
     to_section_height: float = Field(
@@ -182,7 +199,7 @@ class SectionHeightConfig(BaseModel):
     )
 
 
-class LabelLayoutConfig(BaseModel):
+class LabelLayoutConfig(_FrozenModel):
     """レターパックラベルのレイアウト全体設定"""
 
     layout: LayoutConfig = Field(default_factory=LayoutConfig)
@@ -197,7 +214,7 @@ class LabelLayoutConfig(BaseModel):
     section_height: SectionHeightConfig = Field(default_factory=SectionHeightConfig)
 
     @model_validator(mode="after")
-    def validate_section_heights(self) -> "LabelLayoutConfig":
+    def validate_section_heights(self) -> LabelLayoutConfig:
         """セクション高さの合計がlabel_heightと一致することを検証"""
         total_height = (
             self.section_height.to_section_height + self.section_height.from_section_height
@@ -213,6 +230,174 @@ class LabelLayoutConfig(BaseModel):
         return self
 
 
+# 検証済みのデフォルト設定（不変のため全呼び出しで共有する）
+_DEFAULT_LAYOUT = LabelLayoutConfig()
+
+
+# パース済みレイアウト設定をYAMLファイルの隣に保存する際のサフィックス
+LAYOUT_CACHE_SUFFIX = ".cache.json"
+
+
+def _json_loads(data: bytes):
+    """
+    JSONを読み込む（orjsonは任意依存のため、未インストールの場合は標準ライブラリを使う）
+
+    Args:
+        data: JSONのバイト列
+
+    Returns:
+        読み込んだ値
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    JSONのバイト列に変換する（orjsonは任意依存のため、未インストールの場合は標準ライブラリを使う）
+
+    Args:
+        obj: 変換する値
+
+    Returns:
+        UTF-8のJSONバイト列
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    return orjson.dumps(obj)
+
+
+def _read_layout_cache(config_path: str, digest: str) -> tuple[bool, dict | None]:
+    """
+    設定ファイルと内容のハッシュが一致するJSONキャッシュがあれば読み込む
+
+    Args:
+        config_path: 設定ファイルの絶対パス
+        digest: 設定ファイルの内容のSHA-256（16進文字列）
+
+    Returns:
+        (キャッシュが有効だったか, パース済みの設定辞書)
+    """
+    try:
+        with open(config_path + LAYOUT_CACHE_SUFFIX, "rb") as f:
+            cache = _json_loads(f.read())
+        if cache["source"] != digest:
+            return False, None
+        return True, cache["config"]
+    except (OSError, ValueError, TypeError, KeyError):
+        # キャッシュがない・古い・壊れている場合はYAMLをパースし直す
+        return False, None
+
+
+def _write_layout_cache(config_path: str, digest: str, config_data: dict | None) -> None:
+    """
+    パース済みの設定をJSONキャッシュとしてYAMLファイルの隣に保存する
+
+    書き込めない場合（読み取り専用のディレクトリなど）やJSONで表現できない値を
+    含む場合は何もしない。
+
+    Args:
+        config_path: 設定ファイルの絶対パス
+        digest: パースした設定ファイルの内容のSHA-256（16進文字列）
+        config_data: パース済みの設定辞書
+    """
+    cache_path = config_path + LAYOUT_CACHE_SUFFIX
+    try:
+        data = _json_dumps({"source": digest, "config": config_data})
+    except (TypeError, ValueError):
+        return
+
+    tmp_path = None
+    try:
+        # 一時ファイル名はmkstempで決め、同じプロセス内の別スレッドとも衝突させない
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(cache_path),
+            prefix=os.path.basename(cache_path) + ".",
+            suffix=".tmp",
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # 並行して読み込むプロセスが書きかけのファイルを読まないよう置き換える
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+    except OSError:
+        pass
+    finally:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_layout_yaml(config_path: str, mtime_ns: int, size: int) -> dict | None:
+    """
+    レイアウト設定のYAMLファイルをパースし、結果をキャッシュする
+
+    キャッシュキーに更新時刻とサイズを含めるため、ファイルが書き換えられると
+    自動的に再パースされる。内容のハッシュが一致するJSONキャッシュがあれば
+    YAMLのパースを省略する（git checkoutなどで更新時刻だけが変わった場合も有効）。
+
+    Args:
+        config_path: 設定ファイルの絶対パス
+        mtime_ns: 設定ファイルの更新時刻（ナノ秒）
+        size: 設定ファイルのサイズ
+
+    Returns:
+        パースされた設定辞書（空のYAMLファイルの場合はNone）
+    """
+    with open(config_path, "rb") as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    hit, config_data = _read_layout_cache(config_path, digest)
+    if hit:
+        return config_data
+
+    import yaml
+
+    # libyamlが利用可能ならC実装のローダーを使い、なければ純Python実装にフォールバックする
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    config_data = yaml.load(content.decode("utf-8"), Loader=loader)
+    _write_layout_cache(config_path, digest, config_data)
+    return config_data
+
+
+@functools.lru_cache(maxsize=16)
+def _validate_layout_json(config_json: str) -> LabelLayoutConfig:
+    """
+    正規化したJSON文字列から設定を検証し、結果を内容ごとにキャッシュする
+
+    Args:
+        config_json: sort_keys=Trueでシリアライズした設定辞書
+
+    Returns:
+        LabelLayoutConfig: 検証済みのレイアウト設定（不変のため共有して問題ない）
+    """
+    return LabelLayoutConfig(**json.loads(config_json))
+
+
+def _build_layout_config(config_data: dict) -> LabelLayoutConfig:
+    """
+    設定辞書からLabelLayoutConfigを構築する（同じ内容の辞書は検証を省略）
+
+    Args:
+        config_data: 設定辞書
+
+    Returns:
+        LabelLayoutConfig: 検証済みのレイアウト設定
+    """
+    try:
+        config_json = json.dumps(config_data, sort_keys=True)
+    except (TypeError, ValueError):
+        # JSONで表現できない値を含む場合はキャッシュせずに検証する
+        return LabelLayoutConfig(**config_data)
+    return _validate_layout_json(config_json)
+
+
 def load_layout_config(
     config_path: str | None = None, config_dict: dict | None = None
 ) -> LabelLayoutConfig:
@@ -232,6 +417,9 @@ def load_layout_config(
 
     Note:
         - config_dictとconfig_pathの両方が指定された場合、config_dictが優先されます
+        - YAMLのパース結果はパス・更新時刻・サイズごとにキャッシュされ、
+          ファイルが書き換えられると自動的に再読み込みされます
+        - 同じ内容の設定は検証済みのインスタンスを共有します（設定モデルは変更不可）
         - 将来的な拡張:
           * UI上で設定を変更できる機能を追加
           * 変更した設定をlocalStorageに保存
@@ -242,34 +430,149 @@ def load_layout_config(
     if config_dict is not None:
         if not config_dict:
             # 空の辞書の場合はデフォルト設定を返す
-            return LabelLayoutConfig()
+            return _DEFAULT_LAYOUT
         # 辞書から設定オブジェクトを構築
-        return LabelLayoutConfig(**config_dict)
+        return _build_layout_config(config_dict)
 
     # ファイルパスが指定されていない場合はデフォルト設定を使用
     if config_path is None:
-        return LabelLayoutConfig()
+        return _DEFAULT_LAYOUT
 
     # YAMLファイルから設定を読み込む
-    config_file = Path(config_path)
-    if not config_file.exists():
-        raise FileNotFoundError(f"設定ファイルが見つかりません: {config_path}")
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        raise FileNotFoundError(f"設定ファイルが見つかりません: {config_path}") from None
+
+    if st.st_size == 0:
+        # 空のファイルはパースせずにデフォルト設定を使用（サイズはstatの結果を流用する）
+        return _DEFAULT_LAYOUT
+
+    import yaml
 
     try:
-        with open(config_file, encoding="utf-8") as f:
-            config_data = yaml.safe_load(f)
+        # 同じファイルを何度もパースしないようキャッシュを使う
+        # （キャッシュした辞書は検証に渡すだけで変更しないため、コピーは不要）
+        config_data = _load_layout_yaml(os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
 
         if config_data is None:
             # 空のYAMLファイルの場合はデフォルト設定を使用
-            return LabelLayoutConfig()
+            return _DEFAULT_LAYOUT
 
-        return LabelLayoutConfig(**config_data)
+        return _build_layout_config(config_data)
     except yaml.YAMLError as e:
         raise ValueError(f"YAML形式が不正です: {e}") from e
     except Exception as e:
         raise ValueError(f"設定ファイルの読み込みに失敗しました: {e}") from e
 
 
+def clear_layout_cache() -> None:
+    """
+    load_layout_configのプロセス内キャッシュを破棄する
+
+    YAMLのパース結果と検証済みの設定インスタンスの両方を破棄する。
+    YAMLファイルの隣に保存したJSONキャッシュは削除しない。
+    """
+    _load_layout_yaml.cache_clear()
+    _validate_layout_json.cache_clear()
+
+
+# 登録済みのフォント（フォント名 → TTFファイルのパス。CIDフォントの場合はNone）
+_REGISTERED_FONTS: dict[str, str | None] = {}
+
+
+def _register_font(font_name: str, font_path: str | None = None) -> None:
+    """
+    フォントをreportlabに登録する
+
+    フォントの登録（TTFファイルの解析）はプロセス全体で有効なため、
+    同じフォントを登録済みの場合は何もしない。
+
+    Args:
+        font_name: 登録するフォント名
+        font_path: TTFファイルのパス（Noneの場合はreportlab組み込みのCIDフォント）
+    """
+    if font_name in _REGISTERED_FONTS and _REGISTERED_FONTS[font_name] == font_path:
+        return
+
+    from reportlab.pdfbase import pdfmetrics
+
+    if font_path is None:
+        from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
+        font = UnicodeCIDFont(font_name)
+    else:
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        font = TTFont(font_name, font_path)
+    pdfmetrics.registerFont(font)
+    _REGISTERED_FONTS[font_name] = font_path
+
+
+@functools.cache
+def _setup_default_fonts() -> tuple[str, str]:
+    """
+    デフォルトの日本語フォントを探して登録する
+
+    フォントファイルの存在確認と登録はプロセス全体で有効なため、結果をキャッシュして
+    2つ目以降のLabelGeneratorでは探索を省略する。
+
+    Returns:
+        (通常フォント名, 太字フォント名)
+    """
+    # デフォルトフォント: IPAフォント（完全な日本語サポート）
+    # システムにインストールされている日本語フォントを探す
+    ipa_font_paths = [
+        "/usr/share/fonts/opentype/ipafont-gothic/ipag.ttf",
+        "/usr/share/fonts/truetype/fonts-japanese-gothic.ttf",
+        "/usr/share/fonts/truetype/ipafont/ipag.ttf",
+    ]
+
+    # IPAGothic太字版のパス
+    ipa_bold_font_paths = [
+        "/usr/share/fonts/opentype/ipafont-gothic/ipagp.ttf",
+        "/usr/share/fonts/truetype/ipafont/ipagp.ttf",
+    ]
+
+    for font_path in ipa_font_paths:
+        if os.path.exists(font_path):
+            try:
+                _register_font("IPAGothic", font_path)
+                # 太字フォントも探す
+                for bold_font_path in ipa_bold_font_paths:
+                    if os.path.exists(bold_font_path):
+                        try:
+                            _register_font("IPAGothicBold", bold_font_path)
+                            return "IPAGothic", "IPAGothicBold"
+                        except Exception:
+                            continue
+                # 太字フォントが見つからない場合は通常フォントを使用
+                return "IPAGothic", "IPAGothic"
+            except Exception as e:
+                print(f"警告: IPAGothic ({font_path}) の登録に失敗しました: {e}")
+                continue
+
+    # フォールバック: ReportLabのCJKフォント
+    try:
+        _register_font("HeiseiMin-W3")
+        print(
+            "警告: IPAフォントが見つかりません。HeiseiMin-W3を使用します（一部の文字が表示されない可能性があります）"
+        )
+        return "HeiseiMin-W3", "HeiseiMin-W3"
+    except Exception as e:
+        print(f"警告: HeiseiMin-W3の登録に失敗しました: {e}")
+    # 最終フォールバック: HeiseiKakuGo-W5を試す
+    try:
+        _register_font("HeiseiKakuGo-W5")
+        print("警告: HeiseiKakuGo-W5を使用します（一部の文字が表示されない可能性があります）")
+        return "HeiseiKakuGo-W5", "HeiseiKakuGo-W5"
+    except Exception as e2:
+        print(f"警告: HeiseiKakuGo-W5の登録にも失敗しました: {e2}")
+    # 最終フォールバック: Helvetica（日本語は表示できないが動作する）
+    print("警告: 日本語フォントが利用できません。Helveticaを使用します")
+    return "Helvetica", "Helvetica-Bold"
+
+
 class LabelGenerator:
     """レターパックラベルPDF生成クラス"""
 
@@ -298,7 +601,7 @@ class LabelGenerator:
         if self.font_path and os.path.exists(self.font_path):
             # カスタムフォントを登録
             try:
-                pdfmetrics.registerFont(TTFont("CustomFont", self.font_path))
+                _register_font("CustomFont", self.font_path)
                 self.font_name = "CustomFont"
                 self.bold_font_name = "CustomFont"  # 太字版がない場合は通常フォントを使用
                 return
@@ -306,66 +609,8 @@ class LabelGenerator:
                 print(f"警告: カスタムフォントの読み込みに失敗しました: {e}")
                 print("デフォルトフォントを使用します")
 
-        # デフォルトフォント: IPAフォント（完全な日本語サポート）
-        # システムにインストールされている日本語フォントを探す
-        ipa_font_paths = [
-            "/usr/share/fonts/opentype/ipafont-gothic/ipag.ttf",
-            "/usr/share/fonts/truetype/fonts-japanese-gothic.ttf",
-            "/usr/share/fonts/truetype/ipafont/ipag.ttf",
-        ]
-
-        # IPAGothic太字版のパス
-        ipa_bold_font_paths = [
-            "/usr/share/fonts/opentype/ipafont-gothic/ipagp.ttf",
-            "/usr/share/fonts/truetype/ipafont/ipagp.ttf",
-        ]
-
-        for font_path in ipa_font_paths:
-            if os.path.exists(font_path):
-                try:
-                    pdfmetrics.registerFont(TTFont("IPAGothic", font_path))
-                    self.font_name = "IPAGothic"
-                    # 太字フォントも探す
-                    for bold_font_path in ipa_bold_font_paths:
-                        if os.path.exists(bold_font_path):
-                            try:
-                                pdfmetrics.registerFont(TTFont("IPAGothicBold", bold_font_path))
-                                self.bold_font_name = "IPAGothicBold"
-                                break
-                            except Exception:
-                                continue
-                    # 太字フォントが見つからない場合は通常フォントを使用
-                    if not self.bold_font_name:
-                        self.bold_font_name = "IPAGothic"
-                    return
-                except Exception as e:
-                    print(f"警告: IPAGothic ({font_path}) の登録に失敗しました: {e}")
-                    continue
-
-        # フォールバック: ReportLabのCJKフォント
-        try:
-            pdfmetrics.registerFont(UnicodeCIDFont("HeiseiMin-W3"))
-            self.font_name = "HeiseiMin-W3"
-            self.bold_font_name = "HeiseiMin-W3"
-            print(
-                "警告: IPAフォントが見つかりません。HeiseiMin-W3を使用します（一部の文字が表示されない可能性があります）"
-            )
-        except Exception as e:
-            print(f"警告: HeiseiMin-W3の登録に失敗しました: {e}")
-            # 最終フォールバック: HeiseiKakuGo-W5を試す
-            try:
-                pdfmetrics.registerFont(UnicodeCIDFont("HeiseiKakuGo-W5"))
-                self.font_name = "HeiseiKakuGo-W5"
-                self.bold_font_name = "HeiseiKakuGo-W5"
-                print(
-                    "警告: HeiseiKakuGo-W5を使用します（一部の文字が表示されない可能性があります）"
-                )
-            except Exception as e2:
-                print(f"警告: HeiseiKakuGo-W5の登録にも失敗しました: {e2}")
-                # 最終フォールバック: Helvetica（日本語は表示できないが動作する）
-                self.font_name = "Helvetica"
-                self.bold_font_name = "Helvetica-Bold"
-                print("警告: 日本語フォントが利用できません。Helveticaを使用します")
+        # デフォルトフォント（システムフォントの探索はプロセスごとに1回だけ行う）
+        self.font_name, self.bold_font_name = _setup_default_fonts()
 
     def generate(self, to_address: AddressInfo, from_address: AddressInfo, output_path: str) -> str:
         """
@@ -374,11 +619,13 @@ class LabelGenerator:
         Args:
             to_address: お届け先情報
             from_address: ご依頼主情報
-            output_path: 出力PDFファイルパス
+            output_path: 出力PDFファイルパス（書き込み可能なファイルオブジェクトも指定可能）
 
         Returns:
             生成されたPDFファイルのパス
         """
+        from reportlab.pdfgen import canvas
+
         c = canvas.Canvas(output_path, pagesize=A4)
         width, height = A4
 
@@ -410,6 +657,23 @@ class LabelGenerator:
         c.save()
         return output_path
 
+    def generate_bytes(self, to_address: AddressInfo, from_address: AddressInfo) -> bytes:
+        """
+        ラベルPDFをメモリ上に生成し、バイト列として返す
+
+        HTTPレスポンスなどファイルに保存する必要がない場合に使用する。
+
+        Args:
+            to_address: お届け先情報
+            from_address: ご依頼主情報
+
+        Returns:
+            生成されたPDFのバイト列
+        """
+        buffer = io.BytesIO()
+        self.generate(to_address, from_address, buffer)
+        return buffer.getvalue()
+
     def _draw_single_label(
         self,
         c: canvas.Canvas,
@@ -743,23 +1007,9 @@ class LabelGenerator:
         Returns:
             分割された住所のリスト
         """
-        if len(address) <= max_length:
-            return [address]
-
-        lines = []
-        current_line = ""
-
-        for char in address:
-            if len(current_line) >= max_length:
-                lines.append(current_line)
-                current_line = char
-            else:
-                current_line += char
-
-        if current_line:
-            lines.append(current_line)
-
-        return lines
+        # 文字数で固定幅に切り出す（空文字列の場合は [""] を返す）
+        lines = [address[i : i + max_length] for i in range(0, len(address), max_length)]
+        return lines or [address]
 
     def generate_batch(
         self, label_pairs: list[tuple[AddressInfo, AddressInfo]], output_path: str
@@ -774,6 +1024,8 @@ class LabelGenerator:
         Returns:
             生成されたPDFファイルのパス
         """
+        from reportlab.pdfgen import canvas
+
         c = canvas.Canvas(output_path, pagesize=A4)
         width, height = A4
 
@@ -835,6 +1087,32 @@ def create_label(
     return generator.generate(to_address, from_address, output_path)
 
 
+def create_label_bytes(
+    to_address: AddressInfo,
+    from_address: AddressInfo,
+    font_path: str | None = None,
+    config_path: str | None = None,
+    config_dict: dict | None = None,
+) -> bytes:
+    """
+    ラベルPDFをメモリ上に生成し、バイト列として返す便利関数
+
+    Args:
+        to_address: お届け先情報
+        from_address: ご依頼主情報
+        font_path: 日本語フォントのパス
+        config_path: レイアウト設定ファイルのパス（Noneの場合はデフォルト設定を使用）
+        config_dict: レイアウト設定辞書（静的HTML版やUI設定から渡される場合に使用）
+
+    Returns:
+        生成されたPDFのバイト列
+    """
+    generator = LabelGenerator(
+        font_path=font_path, config_path=config_path, config_dict=config_dict
+    )
+    return generator.generate_bytes(to_address, from_address)
+
+
 def create_label_batch(
     label_pairs: list[tuple[AddressInfo, AddressInfo]],
     output_path: str = "labels.pdf",
@@ -859,3 +1137,100 @@ def create_label_batch(
         font_path=font_path, config_path=config_path, config_dict=config_dict
     )
     return generator.generate_batch(label_pairs, output_path)
+
+
+# ワーカープロセスごとに1つだけ生成するLabelGenerator（create_labels_batch用）
+_worker_generator: LabelGenerator | None = None
+
+
+def _init_label_worker(
+    font_path: str | None, config_path: str | None, config_dict: dict | None
+) -> None:
+    """
+    ワーカープロセスの初期化（フォント登録と設定読み込みをプロセスごとに1回にする）
+
+    Args:
+        font_path: 日本語フォントのパス
+        config_path: レイアウト設定ファイルのパス
+        config_dict: レイアウト設定辞書
+    """
+    global _worker_generator
+    _worker_generator = LabelGenerator(
+        font_path=font_path, config_path=config_path, config_dict=config_dict
+    )
+
+
+def _generate_label_in_worker(
+    to_address: AddressInfo, from_address: AddressInfo, output_path: str
+) -> str:
+    """
+    ワーカープロセスでラベルPDFを1件生成する
+
+    Args:
+        to_address: お届け先情報
+        from_address: ご依頼主情報
+        output_path: 出力PDFファイルパス
+
+    Returns:
+        生成されたPDFファイルのパス
+    """
+    return _worker_generator.generate(to_address, from_address, output_path)
+
+
+def create_labels_batch(
+    label_pairs: list[tuple[AddressInfo, AddressInfo]],
+    output_dir: str,
+    workers: int | None = None,
+    font_path: str | None = None,
+    config_path: str | None = None,
+    config_dict: dict | None = None,
+) -> list[str]:
+    """
+    複数のラベルをそれぞれ個別のPDFとして並列に生成する便利関数
+
+    1つのPDFにまとめる場合は create_label_batch を使用してください。
+
+    Args:
+        label_pairs: (お届け先, ご依頼主) のタプルのリスト
+        output_dir: 出力先ディレクトリ（存在しない場合は作成）
+        workers: ワーカープロセス数（Noneの場合はCPU数）
+        font_path: 日本語フォントのパス
+        config_path: レイアウト設定ファイルのパス（Noneの場合はデフォルト設定を使用）
+        config_dict: レイアウト設定辞書（静的HTML版やUI設定から渡される場合に使用）
+
+    Returns:
+        生成されたPDFファイルのパスのリスト（label_pairsと同じ順序）
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    os.makedirs(output_dir, exist_ok=True)
+    digits = len(str(len(label_pairs)))
+    output_paths = [
+        os.path.join(output_dir, f"label_{i:0{digits}d}.pdf")
+        for i in range(1, len(label_pairs) + 1)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(label_pairs))
+
+    # 1件またはワーカー1つの場合はプロセス起動のコストを避けて同じプロセスで生成する
+    if workers <= 1:
+        generator = LabelGenerator(
+            font_path=font_path, config_path=config_path, config_dict=config_dict
+        )
+        return [
+            generator.generate(to_addr, from_addr, path)
+            for (to_addr, from_addr), path in zip(label_pairs, output_paths, strict=True)
+        ]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_label_worker,
+        initargs=(font_path, config_path, config_dict),
+    ) as executor:
+        return list(
+            executor.map(
+                _generate_label_in_worker,
+                [to_addr for to_addr, _ in label_pairs],
+                [from_addr for _, from_addr in label_pairs],
+                output_paths,
+            )
+        )
@@ -8,7 +8,6 @@ import os
 import sys
 import tempfile
 
-import yaml
 from flask import (
     Flask,
     after_this_request,
@@ -21,7 +20,7 @@ from flask import (
 )
 
 from .csv_parser import parse_csv
-from .label import AddressInfo, create_label, create_label_batch
+from .label import AddressInfo, LabelGenerator, create_label_batch
 
 app = Flask(__name__)
 
@@ -626,46 +625,17 @@ def generate_pdf():
             honorific=from_honorific,
         )
 
-        # レイアウト設定ファイルを一時作成（デフォルト以外の場合のみ）
-        config_path = None
+        # レイアウト設定（デフォルト以外の場合のみ）
+        config_dict = None
         if layout_mode != "center":
-            with tempfile.NamedTemporaryFile(
-                mode="w", delete=False, suffix=".yaml", encoding="utf-8"
-            ) as tmp_config:
-                config_data = {"layout": {"layout_mode": layout_mode}}
-                yaml.dump(config_data, tmp_config)
-                config_path = tmp_config.name
-
-        # 一時ファイルにPDF生成
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-            output_path = tmp_file.name
-
-        create_label(to_info, from_info, output_path, config_path=config_path)
-
-        # レスポンス送信後に一時ファイルを削除するコールバックを登録
-        @after_this_request
-        def remove_temp_file(response):
-            try:
-                os.remove(output_path)
-            except Exception as e:
-                # ログに記録するが、エラーを無視してレスポンスは返す
-                print(
-                    f"警告: 一時ファイルの削除に失敗: {output_path}, エラー: {e}", file=sys.stderr
-                )
-            # 設定ファイルも削除
-            if config_path:
-                try:
-                    os.remove(config_path)
-                except Exception as e:
-                    print(
-                        f"警告: 一時設定ファイルの削除に失敗: {config_path}, エラー: {e}",
-                        file=sys.stderr,
-                    )
-            return response
+            config_dict = {"layout": {"layout_mode": layout_mode}}
+
+        # 一時ファイルを作らずメモリ上でPDFを生成
+        pdf_bytes = LabelGenerator(config_dict=config_dict).generate_bytes(to_info, from_info)
 
         # PDFを送信
         return send_file(
-            output_path,
+            io.BytesIO(pdf_bytes),
             as_attachment=True,
             download_name="letterpack_label.pdf",
             mimetype="application/pdf",
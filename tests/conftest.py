@@ -1,13 +1,17 @@
 """
-テスト起動条件の管理
+テスト起動条件の管理と共有フィクスチャ
 ファイル変更に基づいてテストを条件付きスキップする機能を提供
 """
 
+import dataclasses
+import hashlib
 import subprocess
 from pathlib import Path
 
 import pytest
 
+from letterpack.label import AddressInfo, LabelGenerator
+
 
 def get_changed_files() -> set[str]:
     """
@@ -69,3 +73,108 @@ def pytest_collection_modifyitems(config, items):
         if dependencies and not any(dep in changed_files for dep in dependencies):
             skip_reason = f"No changes in dependent files: {', '.join(sorted(dependencies))}"
             item.add_marker(pytest.mark.skip(reason=skip_reason))
+
+
+@pytest.fixture(scope="session")
+def shared_generator():
+    """
+    デフォルト設定のLabelGenerator
+
+    フォント登録と設定読み込みをセッション内で1回にするため共有する。
+    生成後に状態を変更しないテストからのみ使うこと。
+    """
+    return LabelGenerator()
+
+
+@pytest.fixture(scope="session")
+def shibuya_to_osaka():
+    """お届け先（東京都渋谷区）とご依頼主（大阪府大阪市）の組"""
+    to_addr = AddressInfo(
+        postal_code="123-4567",
+        address1="東京都渋谷区XXX 1-2-3",
+        name="山田太郎",
+        phone="03-1234-5678",
+    )
+    from_addr = AddressInfo(
+        postal_code="987-6543",
+        address1="大阪府大阪市YYY 4-5-6",
+        name="田中花子",
+        phone="06-9876-5432",
+    )
+    return to_addr, from_addr
+
+
+@pytest.fixture(scope="session")
+def shibuya_to_osaka_sama(shibuya_to_osaka):
+    """shibuya_to_osakaのお届け先に敬称「様」を付けた組"""
+    to_addr, from_addr = shibuya_to_osaka
+    return dataclasses.replace(to_addr, honorific="様"), from_addr
+
+
+@pytest.fixture(scope="session")
+def shibuya_to_osaka_no_phone(shibuya_to_osaka):
+    """shibuya_to_osakaの両方の住所から電話番号を除いた組"""
+    to_addr, from_addr = shibuya_to_osaka
+    return dataclasses.replace(to_addr, phone=None), dataclasses.replace(from_addr, phone=None)
+
+
+@pytest.fixture(scope="session")
+def chiyoda_to_umeda():
+    """お届け先（東京都千代田区）とご依頼主（大阪市北区梅田）の組"""
+    to_addr = AddressInfo(
+        postal_code="100-0001",
+        address1="東京都千代田区千代田1-1",
+        name="テスト太郎",
+        phone="03-0000-0000",
+    )
+    from_addr = AddressInfo(
+        postal_code="530-0001",
+        address1="大阪府大阪市北区梅田1-1",
+        name="テスト花子",
+        phone="06-0000-0000",
+    )
+    return to_addr, from_addr
+
+
+@pytest.fixture
+def yaml_config(tmp_path):
+    """
+    YAMLの内容から設定ファイルを作成する関数
+
+    load_layout_configは設定ファイルの隣にJSONキャッシュを書き込むため、
+    tmp_pathに作成してテスト後にキャッシュごと削除されるようにする。
+    """
+    root = tmp_path / "yaml"
+    root.mkdir()
+
+    def _make(body: str) -> str:
+        digest = hashlib.blake2b(body.encode("utf-8"), digest_size=8).hexdigest()
+        config_path = root / f"{digest}.yaml"
+        if not config_path.exists():
+            config_path.write_text(body, encoding="utf-8")
+        return str(config_path)
+
+    return _make
+
+
+@pytest.fixture
+def custom_config_path(yaml_config):
+    """カスタム設定ファイル（セクション高さの合計がlabel_heightと一致するように設定）"""
+    # セクション高さの合計が210mmになるように設定
+    return yaml_config(
+        """
+layout:
+  label_width: 148
+  label_height: 210
+  margin: 10
+fonts:
+  label: 10
+  postal_code: 11
+  address: 12
+  name: 15
+  phone: 12
+section_height:
+  to_section_height: 140
+  from_section_height: 70
+"""
+    )
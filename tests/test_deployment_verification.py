@@ -6,18 +6,17 @@ GitHub Pages検証のテスト
 
 from __future__ import annotations
 
-import sys
 from pathlib import Path
 
 import pytest
 
-# tools/deployment_verifier.pyをインポートできるようにパスを追加
-sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from deployment_verifier import GitHubPagesVerifier, LinkCheckResult, _load_config
 
-from deployment_verifier import GitHubPagesVerifier, LinkCheckResult
-
-# このファイルの全テストにdeployment_verificationマーカーを適用
-pytestmark = pytest.mark.deployment_verification
+# このファイルの全テストにdeployment_verificationマーカーとxdistグループを適用
+pytestmark = [
+    pytest.mark.deployment_verification,
+    pytest.mark.xdist_group("deploy"),
+]
 
 
 @pytest.fixture
@@ -124,6 +123,26 @@ class TestLinkCheckResult:
         assert result.is_external is True
 
 
+class TestConfigLoading:
+    """設定ファイル読み込みのテスト"""
+
+    def test_config_is_cached_but_not_shared(self, tmp_path):
+        """同じ設定ファイルは1回だけパースされ、インスタンスごとに独立したコピーになる"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("docker:\n  image_name: cached-image\n", encoding="utf-8")
+
+        first = GitHubPagesVerifier(config_path)
+        hits_before = _load_config.cache_info().hits
+        second = GitHubPagesVerifier(config_path)
+
+        assert _load_config.cache_info().hits == hits_before + 1
+        assert second.config == first.config
+        assert second.config is not first.config
+
+        first.config["docker"]["image_name"] = "modified"
+        assert second.config["docker"]["image_name"] == "cached-image"
+
+
 @pytest.mark.integration
 class TestGitHubPagesIntegration:
     """GitHub Pages統合テスト"""
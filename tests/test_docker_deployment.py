@@ -6,14 +6,10 @@ Docker環境検証のテスト
 
 from __future__ import annotations
 
-import sys
 from pathlib import Path
 
 import pytest
 
-# tools/deployment_verifier.pyをインポートできるようにパスを追加
-sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
-
 try:
     import docker
 
@@ -23,25 +19,17 @@ except ImportError:
 
 from deployment_verifier import DockerVerifier
 
-# このファイルの全テストにdeployment_verificationマーカーとskipifを適用
+# このファイルの全テストにdeployment_verificationマーカー、xdistグループとskipifを適用
 pytestmark = [
     pytest.mark.deployment_verification,
+    pytest.mark.xdist_group("docker"),
     pytest.mark.skipif(not DOCKER_AVAILABLE, reason="Docker SDK not installed"),
 ]
 
 
-@pytest.fixture
-def docker_verifier():
-    """Docker検証のフィクスチャ"""
-    config_path = (
-        Path(__file__).parent.parent / ".claude/skills/deployment-verification/config.yaml"
-    )
-    return DockerVerifier(config_path)
-
-
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def docker_client():
-    """Dockerクライアントのフィクスチャ"""
+    """Dockerクライアントのフィクスチャ（デーモンへの接続確認はセッションで1回のみ）"""
     if not DOCKER_AVAILABLE:
         pytest.skip("Docker SDK not installed")
 
@@ -54,6 +42,21 @@ def docker_client():
         pytest.skip(f"Docker daemon not running: {e}")
 
 
+@pytest.fixture(scope="session")
+def docker_verifier(docker_client):
+    """Docker検証のフィクスチャ（デーモンが動いていない場合はスキップ）"""
+    config_path = (
+        Path(__file__).parent.parent / ".claude/skills/deployment-verification/config.yaml"
+    )
+    return DockerVerifier(config_path, client=docker_client)
+
+
+@pytest.fixture(scope="session")
+def built_image(docker_verifier):
+    """イメージのビルドからヘルスチェックまでの検証結果（セッションで1回のみ実行）"""
+    return docker_verifier.verify(build_image=True)
+
+
 @pytest.mark.docker
 class TestDockerDeployment:
     """Docker デプロイメントのテスト"""
@@ -64,9 +67,9 @@ class TestDockerDeployment:
         assert docker_client.ping() is True
 
     @pytest.mark.slow
-    def test_image_builds(self, docker_verifier):
+    def test_image_builds(self, built_image):
         """Dockerイメージがビルドできるかテスト"""
-        result = docker_verifier.verify(build_image=True)
+        result = built_image
 
         assert result.build_success, f"Image build failed: {result.errors}"
         assert result.image_id is not None, "Image ID not set"
@@ -74,9 +77,9 @@ class TestDockerDeployment:
         assert result.image_size_mb > 0, "Image size is zero"
 
     @pytest.mark.slow
-    def test_image_size_reasonable(self, docker_verifier):
+    def test_image_size_reasonable(self, docker_verifier, built_image):
         """イメージサイズが妥当かテスト"""
-        result = docker_verifier.verify(build_image=True)
+        result = built_image
 
         assert result.build_success, "Build must succeed first"
 
@@ -89,16 +92,16 @@ class TestDockerDeployment:
         )
 
     @pytest.mark.slow
-    def test_container_starts(self, docker_verifier):
+    def test_container_starts(self, built_image):
         """コンテナが起動するかテスト"""
-        result = docker_verifier.verify(build_image=False)
+        result = built_image
 
         assert result.container_started, "Container failed to start"
 
     @pytest.mark.slow
-    def test_health_check_passes(self, docker_verifier):
+    def test_health_check_passes(self, docker_verifier, built_image):
         """ヘルスチェックが通るかテスト"""
-        result = docker_verifier.verify(build_image=False)
+        result = built_image
 
         # ヘルスチェックの結果を確認（警告の場合もあり得る）
         if not result.health_check_passed and result.warnings:
@@ -125,9 +128,9 @@ class TestDockerIntegration:
     """Docker統合テスト"""
 
     @pytest.mark.slow
-    def test_full_docker_verification(self, docker_verifier):
+    def test_full_docker_verification(self, built_image):
         """完全なDocker検証を実行"""
-        result = docker_verifier.verify(build_image=True)
+        result = built_image
 
         # 基本的なアサーション
         assert result is not None
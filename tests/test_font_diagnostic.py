@@ -3,11 +3,9 @@
 """
 
 import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-# toolsディレクトリをインポートパスに追加
-sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+import pytest
 
 from font_diagnostic import (
     analyze_pdf_fonts,
@@ -19,6 +17,9 @@ from font_diagnostic import (
     read_label_py_font_config,
 )
 
+# pytest-xdist（--dist=loadgroup）で同じワーカーにまとめて実行するグループ
+pytestmark = pytest.mark.xdist_group("fonts")
+
 
 def test_detect_environment():
     """環境検出のテスト"""
@@ -60,13 +61,10 @@ def test_get_platform_font_dirs():
         assert any("share/fonts" in d for d in dirs)
 
 
-@patch("font_diagnostic.Path")
-def test_find_system_fonts_empty(mock_path):
+def test_find_system_fonts_empty(tmp_path):
     """システムフォント検索のテスト（フォントなし）"""
-    # 存在しないディレクトリをシミュレート
-    mock_path.return_value.exists.return_value = False
-
-    fonts = find_system_fonts()
+    # 存在しないディレクトリを指定
+    fonts = find_system_fonts([str(tmp_path / "nonexistent")])
 
     assert isinstance(fonts, dict)
     assert "noto_cjk" in fonts
@@ -112,22 +110,34 @@ def test_check_reportlab_fonts_error(mock_get_fonts):
     assert fonts == []
 
 
-@patch("font_diagnostic.Path")
-def test_find_system_fonts_permission_error(mock_path_class):
-    """システムフォント検索のパーミッションエラーハンドリング"""
-    # Pathのインスタンスを作成
-    mock_path = MagicMock()
-    mock_path.exists.return_value = True
-    mock_path.rglob.side_effect = PermissionError("Access denied")
+def test_find_system_fonts_unreadable_dir(tmp_path):
+    """システムフォント検索の読み取りエラーハンドリング"""
+    # 存在するが走査できないパス（ディレクトリではなくファイル）を指定
+    not_a_dir = tmp_path / "fonts"
+    not_a_dir.touch()
 
-    # Path()の戻り値を設定
-    mock_path_class.return_value = mock_path
-
-    fonts = find_system_fonts()
+    fonts = find_system_fonts([str(not_a_dir)])
 
     # エラーでも空の結果を返す
     assert isinstance(fonts, dict)
-    assert all(isinstance(v, list) for v in fonts.values())
+    assert all(v == [] for v in fonts.values())
+
+
+def test_find_system_fonts_scandir_walk(tmp_path):
+    """サブディレクトリを含むフォント検索と拡張子による除外"""
+    (tmp_path / "noto" / "cjk").mkdir(parents=True)
+    (tmp_path / "noto" / "cjk" / "NotoSansCJK-Regular.ttc").touch()
+    (tmp_path / "ipa").mkdir()
+    (tmp_path / "ipa" / "ipag.ttf").touch()
+    (tmp_path / "ipa" / "ipam.ttf").touch()
+    (tmp_path / "ipa" / "ipag.txt").touch()
+
+    fonts = find_system_fonts([str(tmp_path)])
+
+    assert fonts["noto_cjk"] == [str(tmp_path / "noto" / "cjk" / "NotoSansCJK-Regular.ttc")]
+    assert fonts["noto_sans"] == []
+    assert fonts["ipa_gothic"] == [str(tmp_path / "ipa" / "ipag.ttf")]
+    assert fonts["ipa_serif"] == [str(tmp_path / "ipa" / "ipam.ttf")]
 
 
 def test_analyze_pdf_fonts_not_found():
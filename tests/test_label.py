@@ -2,167 +2,218 @@
 ラベル生成のテスト
 """
 
-import inspect
+import dataclasses
+import io
 import os
-import shutil
-import tempfile
+import subprocess
+import sys
 
 import pytest
-import yaml
 from pydantic import ValidationError
 
-from letterpack.label import AddressInfo, LabelGenerator, create_label, load_layout_config
+from letterpack.label import (
+    AddressInfo,
+    LabelGenerator,
+    clear_layout_cache,
+    create_label,
+    create_label_bytes,
+    load_layout_config,
+)
 
+# CI環境でPDFを保存する場合の出力先（テスト実行中に変わらないため読み込み時に一度だけ確認する）
+_SAVE_DIR = os.getenv("TEST_OUTPUT_DIR")
+if _SAVE_DIR:
+    os.makedirs(_SAVE_DIR, exist_ok=True)
 
-def save_to_test_output(pdf_path, test_name=None):
+
+def save_to_test_output(pdf, test_name):
     """
     CI環境用にPDFを保存するヘルパー関数
 
     TEST_OUTPUT_DIR環境変数が設定されている場合、
-    生成されたPDFをそのディレクトリにコピーします。
+    生成されたPDF（ファイルパスまたはバイト列）をそのディレクトリに保存します。
     """
-    output_dir = os.getenv("TEST_OUTPUT_DIR")
-    if output_dir and os.path.exists(pdf_path):
-        os.makedirs(output_dir, exist_ok=True)
-        if test_name is None:
-            # 呼び出し元の関数名を取得
-            frame = inspect.currentframe().f_back
-            test_name = frame.f_code.co_name
-        dest_path = os.path.join(output_dir, f"{test_name}.pdf")
-        shutil.copy(pdf_path, dest_path)
-
-
-def test_address_info_creation():
-    """AddressInfoの作成テスト"""
-    addr = AddressInfo(
-        postal_code="123-4567",
-        address1="東京都渋谷区XXX 1-2-3",
-        name="山田太郎",
-        phone="03-1234-5678",
-    )
-    assert addr.postal_code == "123-4567"
-    assert addr.name == "山田太郎"
-
-
-def test_address_info_without_phone():
-    """電話番号なしでAddressInfoを作成するテスト（新機能：電話番号を任意に変更）"""
-    # 電話番号を指定しない場合
-    addr1 = AddressInfo(
-        postal_code="123-4567",
-        address1="東京都渋谷区XXX 1-2-3",
-        name="山田太郎",
-    )
-    assert addr1.phone is None
-
-    # 電話番号にNoneを明示的に指定する場合
-    addr2 = AddressInfo(
-        postal_code="456-7890",
-        address1="大阪府大阪市YYY 4-5-6",
-        name="田中花子",
-        phone=None,
-    )
-    assert addr2.phone is None
-
-
-def test_address_info_validation():
-    """AddressInfoのバリデーションテスト"""
-    with pytest.raises(ValueError):
-        AddressInfo(postal_code="", address1="住所", name="名前", phone="電話")
-
-    with pytest.raises(ValueError):
-        AddressInfo(postal_code="123", address1="", name="名前", phone="電話")
-
-
-def test_label_generation():
-    """PDF生成テスト"""
-    to_addr = AddressInfo(
-        postal_code="123-4567",
-        address1="東京都渋谷区XXX 1-2-3",
-        name="山田太郎",
-        phone="03-1234-5678",
-    )
-    from_addr = AddressInfo(
-        postal_code="987-6543",
-        address1="大阪府大阪市YYY 4-5-6",
-        name="田中花子",
-        phone="06-9876-5432",
+    if not _SAVE_DIR:
+        return
+    dest_path = os.path.join(_SAVE_DIR, f"{test_name}.pdf")
+    if isinstance(pdf, bytes):
+        with open(dest_path, "wb") as f:
+            f.write(pdf)
+    elif os.path.exists(pdf):
+        # TEST_OUTPUT_DIRを指定した場合しか使わないため、ここでインポートする
+        import shutil
+
+        # 権限などのメタデータは不要なので内容だけをコピーする（Linuxではsendfileが使われる）
+        shutil.copyfile(pdf, dest_path)
+
+
+@pytest.fixture
+def save_pdf(request):
+    """生成したPDFを実行中のテスト名でCI用に保存する関数"""
+
+    def _save(pdf, test_name=None):
+        save_to_test_output(pdf, test_name or request.node.name)
+
+    return _save
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """PDFの出力先パス（pytestが一時ディレクトリごと後片付けする）"""
+    return str(tmp_path / "out.pdf")
+
+
+# 一括生成テストで共有する住所（イミュータブルなのでモジュール読み込み時に一度だけ作成）
+_SHARED_FROM = AddressInfo(
+    postal_code="999-9999",
+    address1="送信元住所",
+    name="送信元",
+    phone="099-9999-9999",
+)
+_FIVE_PAIRS = tuple(
+    (
+        AddressInfo(
+            postal_code=f"{100 + i}-0001",
+            address1=f"東京都千代田区{i}-{i}-{i}",
+            name=f"テスト{i}",
+            phone=f"03-0000-000{i}",
+        ),
+        _SHARED_FROM,
     )
-
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-        output_path = tmp_file.name
-
-    try:
-        result = create_label(to_addr, from_addr, output_path)
-        assert os.path.exists(result)
-        assert os.path.getsize(result) > 0
-
-        # CI環境用にPDFを保存
-        save_to_test_output(result)
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
+    for i in range(5)
+)
 
 
-def test_label_generation_without_phone():
-    """電話番号なしでPDF生成テスト（新機能：電話番号を任意に変更）"""
-    to_addr = AddressInfo(
-        postal_code="123-4567",
-        address1="東京都渋谷区XXX 1-2-3",
-        name="山田太郎",
-        phone=None,
+def test_import_does_not_load_pdf_modules():
+    """letterpack.labelのインポート時にPDF生成モジュールとyamlを読み込まないことを確認"""
+    code = (
+        "import sys, letterpack.label; "
+        "print(sorted(m for m in ('yaml', 'reportlab.pdfgen.canvas', "
+        "'reportlab.pdfbase.pdfmetrics') if m in sys.modules))"
     )
-    from_addr = AddressInfo(
-        postal_code="987-6543",
-        address1="大阪府大阪市YYY 4-5-6",
-        name="田中花子",
-        phone=None,
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
     )
+    assert result.stdout.strip() == "[]"
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-        output_path = tmp_file.name
-
-    try:
-        result = create_label(to_addr, from_addr, output_path)
-        assert os.path.exists(result)
-        assert os.path.getsize(result) > 0
-
-        # CI環境用にPDFを保存
-        save_to_test_output(result)
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
-
-
-def test_label_generator_class():
-    """LabelGeneratorクラスのテスト"""
-    generator = LabelGenerator()
-    assert generator is not None
 
-    to_addr = AddressInfo(
-        postal_code="100-0001",
-        address1="東京都千代田区千代田1-1",
-        name="テスト太郎",
-        phone="03-0000-0000",
-    )
-    from_addr = AddressInfo(
-        postal_code="530-0001",
-        address1="大阪府大阪市北区梅田1-1",
-        name="テスト花子",
-        phone="06-0000-0000",
-    )
+@pytest.mark.parametrize(
+    ("kwargs", "expected_phone"),
+    [
+        (
+            {
+                "postal_code": "123-4567",
+                "address1": "東京都渋谷区XXX 1-2-3",
+                "name": "山田太郎",
+                "phone": "03-1234-5678",
+            },
+            "03-1234-5678",
+        ),
+        # 電話番号を指定しない場合（電話番号は任意）
+        (
+            {"postal_code": "123-4567", "address1": "東京都渋谷区XXX 1-2-3", "name": "山田太郎"},
+            None,
+        ),
+        # 電話番号にNoneを明示的に指定する場合
+        (
+            {
+                "postal_code": "456-7890",
+                "address1": "大阪府大阪市YYY 4-5-6",
+                "name": "田中花子",
+                "phone": None,
+            },
+            None,
+        ),
+    ],
+)
+def test_address_info_creation(kwargs, expected_phone):
+    """AddressInfoの作成テスト（電話番号あり・なし）"""
+    addr = AddressInfo(**kwargs)
+    assert addr.postal_code == kwargs["postal_code"]
+    assert addr.name == kwargs["name"]
+    assert addr.phone == expected_phone
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"postal_code": "", "address1": "住所", "name": "名前", "phone": "電話"}, "郵便番号"),
+        ({"postal_code": "123", "address1": "", "name": "名前", "phone": "電話"}, "住所1行目"),
+        ({"postal_code": "123", "address1": "住所", "name": "", "phone": "電話"}, "氏名"),
+    ],
+)
+def test_address_info_validation(kwargs, message):
+    """AddressInfoのバリデーションテスト（必須項目が空の場合はValueError）"""
+    with pytest.raises(ValueError, match=message):
+        AddressInfo(**kwargs)
+
+
+def test_address_info_is_immutable():
+    """AddressInfoが不変（frozen）かつ__slots__を持つことを確認"""
+    addr = AddressInfo(postal_code="123-4567", address1="東京都渋谷区XXX 1-2-3", name="山田太郎")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        addr.name = "別名"
+    assert not hasattr(addr, "__dict__")
+
+
+@pytest.mark.parametrize(
+    ("api", "use_custom_config", "addresses", "test_name"),
+    [
+        ("create_label", False, "shibuya_to_osaka", "test_label_generation"),
+        ("generator", False, "chiyoda_to_umeda", "test_label_generator_class"),
+        ("create_label", True, "shibuya_to_osaka", "test_label_generation_with_custom_config"),
+        ("generator", True, "shibuya_to_osaka", "test_label_generator_with_custom_config"),
+        # 電話番号なし（電話番号は任意項目）
+        (
+            "create_label_bytes",
+            False,
+            "shibuya_to_osaka_no_phone",
+            "test_label_generation_without_phone",
+        ),
+        # 敬称あり・敬称フォントサイズ未指定（名前より2pt小さく描画される）
+        ("create_label_bytes", False, "shibuya_to_osaka_sama", "test_default_honorific_font_size"),
+    ],
+)
+def test_label_generation(
+    api,
+    use_custom_config,
+    addresses,
+    test_name,
+    request,
+    shared_generator,
+    custom_config_path,
+    pdf_path,
+    save_pdf,
+):
+    """create_label関数・create_label_bytes関数・LabelGeneratorクラスでのPDF生成テスト"""
+    to_addr, from_addr = request.getfixturevalue(addresses)
+    config_path = custom_config_path if use_custom_config else None
+
+    if api == "create_label_bytes":
+        # ファイルを介さずにバイト列として生成
+        result = create_label_bytes(to_addr, from_addr, config_path=config_path)
+        assert result.startswith(b"%PDF-")
+    else:
+        if api == "create_label":
+            result = create_label(to_addr, from_addr, pdf_path, config_path=config_path)
+        else:
+            generator = (
+                LabelGenerator(config_path=config_path) if use_custom_config else shared_generator
+            )
+            result = generator.generate(to_addr, from_addr, pdf_path)
+        # 存在しない場合はFileNotFoundErrorになるため、statの1回で存在とサイズを確認する
+        assert os.stat(result).st_size > 0
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-        output_path = tmp_file.name
+    # CI環境用にPDFを保存（パラメータごとに元のテスト名で保存する）
+    save_pdf(result, test_name)
 
-    try:
-        result = generator.generate(to_addr, from_addr, output_path)
-        assert os.path.exists(result)
 
-        # CI環境用にPDFを保存
-        save_to_test_output(result)
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
+def test_generate_bytes(shibuya_to_osaka, shared_generator):
+    """PDFをファイルに書き出さずバイト列として生成するテスト"""
+    to_addr, from_addr = shibuya_to_osaka
+    pdf_bytes = shared_generator.generate_bytes(to_addr, from_addr)
+    assert pdf_bytes.startswith(b"%PDF-")
+    assert pdf_bytes.rstrip().endswith(b"%%EOF")
 
 
 # 設定関連のテスト
@@ -181,6 +232,8 @@ def test_load_default_config():
     assert config.fonts.address == 11
     assert config.fonts.name == 14
     assert config.fonts.phone == 13
+    # 敬称のフォントサイズは未指定（名前より2pt小さく描画される）
+    assert config.fonts.honorific is None
     assert config.postal_box.line_width == 0.5
     assert config.postal_box.text_vertical_offset == 2
     assert config.spacing.postal_box_offset_y == -2
@@ -191,30 +244,42 @@ def test_load_default_config():
     assert config.section_height.from_section_font_scale == 0.7
 
 
-def test_load_custom_config():
+def test_default_config_is_shared():
+    """デフォルト設定は検証済みのインスタンスを共有することを確認"""
+    default = load_layout_config(None)
+    assert load_layout_config(config_dict={}) is default
+    assert LabelGenerator().config is default
+
+
+def test_load_custom_config(yaml_config):
     """カスタム設定の読み込みテスト"""
-    # 一時的な設定ファイルを作成
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yaml") as tmp_file:
-        config_data = {
-            "layout": {"label_width": 150, "label_height": 220, "margin_top": 3, "margin_left": 10},
-            "fonts": {"label": 10, "postal_code": 12, "address": 12, "name": 16, "phone": 12},
-            # セクション高さの合計がlabel_heightと一致するように設定
-            "section_height": {"to_section_height": 150, "from_section_height": 70},
-        }
-        yaml.dump(config_data, tmp_file)
-        config_path = tmp_file.name
+    # 一時的な設定ファイルを作成（セクション高さの合計がlabel_heightと一致するように設定）
+    config_path = yaml_config(
+        """
+layout:
+  label_width: 150
+  label_height: 220
+  margin_top: 3
+  margin_left: 10
+fonts:
+  label: 10
+  postal_code: 12
+  address: 12
+  name: 16
+  phone: 12
+section_height:
+  to_section_height: 150
+  from_section_height: 70
+"""
+    )
 
-    try:
-        config = load_layout_config(config_path)
-        assert config.layout.label_width == 150
-        assert config.layout.label_height == 220
-        assert config.layout.margin_top == 3
-        assert config.layout.margin_left == 10
-        assert config.fonts.label == 10
-        assert config.fonts.postal_code == 12
-    finally:
-        if os.path.exists(config_path):
-            os.remove(config_path)
+    config = load_layout_config(config_path)
+    assert config.layout.label_width == 150
+    assert config.layout.label_height == 220
+    assert config.layout.margin_top == 3
+    assert config.layout.margin_left == 10
+    assert config.fonts.label == 10
+    assert config.fonts.postal_code == 12
 
 
 def test_load_config_file_not_found():
@@ -223,140 +288,65 @@ def test_load_config_file_not_found():
         load_layout_config("/nonexistent/config.yaml")
 
 
-def test_load_empty_config():
+def test_load_empty_config(yaml_config, monkeypatch):
     """空の設定ファイルのテスト"""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yaml") as tmp_file:
-        tmp_file.write("")  # 空のファイル
-        config_path = tmp_file.name
+    config_path = yaml_config("")  # 空のファイル
 
-    try:
-        config = load_layout_config(config_path)
-        # 空のファイルの場合はデフォルト設定が使用される
-        assert config.layout.label_width == 105
-        assert config.fonts.label == 9
-    finally:
-        if os.path.exists(config_path):
-            os.remove(config_path)
+    # 空のファイルはYAMLとしてパースしない
+    monkeypatch.setattr(
+        "letterpack.label._load_layout_yaml", lambda *args: pytest.fail("YAML was parsed")
+    )
+    config = load_layout_config(config_path)
+    # 空のファイルの場合はデフォルト設定が使用される
+    assert config.layout.label_width == 105
+    assert config.fonts.label == 9
 
 
-def test_invalid_config_values():
+def test_invalid_config_values(yaml_config):
     """不正な設定値のバリデーションテスト"""
     # 不正な値（負の値）を含む設定ファイル
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yaml") as tmp_file:
-        config_data = {"layout": {"label_width": -100}}  # 負の値は不正
-        yaml.dump(config_data, tmp_file)
-        config_path = tmp_file.name
+    config_path = yaml_config("layout:\n  label_width: -100\n")  # 負の値は不正
 
-    try:
-        with pytest.raises(ValueError):
-            load_layout_config(config_path)
-    finally:
-        if os.path.exists(config_path):
-            os.remove(config_path)
-
-
-def test_label_generation_with_custom_config():
-    """カスタム設定でのPDF生成テスト"""
-    to_addr = AddressInfo(
-        postal_code="123-4567",
-        address1="東京都渋谷区XXX 1-2-3",
-        name="設定太郎",
-        phone="03-1234-5678",
-    )
-    from_addr = AddressInfo(
-        postal_code="987-6543",
-        address1="大阪府大阪市YYY 4-5-6",
-        name="設定花子",
-        phone="06-9876-5432",
-    )
-
-    # カスタム設定を作成（セクション高さの合計がlabel_heightと一致するように設定）
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yaml") as tmp_config:
-        config_data = {
-            "layout": {"label_width": 148, "label_height": 210, "margin": 10},
-            "fonts": {"label": 10, "postal_code": 11, "address": 12, "name": 15, "phone": 12},
-            # セクション高さの合計が210mmになるように設定
-            "section_height": {"to_section_height": 140, "from_section_height": 70},
-        }
-        yaml.dump(config_data, tmp_config)
-        config_path = tmp_config.name
-
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-        output_path = tmp_pdf.name
-
-    try:
-        result = create_label(to_addr, from_addr, output_path, config_path=config_path)
-        assert os.path.exists(result)
-        assert os.path.getsize(result) > 0
-
-        # CI環境用にPDFを保存
-        save_to_test_output(result)
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
-        if os.path.exists(config_path):
-            os.remove(config_path)
+    with pytest.raises(ValueError):
+        load_layout_config(config_path)
 
 
-def test_label_generator_with_custom_config():
+def test_label_generator_with_custom_config(yaml_config):
     """LabelGeneratorクラスでカスタム設定を使用するテスト"""
     # カスタム設定を作成
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yaml") as tmp_config:
-        config_data = {
-            "layout": {"margin_top": 3, "margin_left": 12},
-            "fonts": {"name": 16},
-        }
-        yaml.dump(config_data, tmp_config)
-        config_path = tmp_config.name
+    config_path = yaml_config(
+        """
+layout:
+  margin_top: 3
+  margin_left: 12
+fonts:
+  name: 16
+"""
+    )
 
-    try:
-        generator = LabelGenerator(config_path=config_path)
-        assert generator.config.layout.margin_top == 3
-        assert generator.config.layout.margin_left == 12
-        assert generator.config.fonts.name == 16
-        # デフォルト値も正しく設定されているか確認
-        assert generator.config.layout.label_width == 105
-    finally:
-        if os.path.exists(config_path):
-            os.remove(config_path)
+    generator = LabelGenerator(config_path=config_path)
+    assert generator.config.layout.margin_top == 3
+    assert generator.config.layout.margin_left == 12
+    assert generator.config.fonts.name == 16
+    # デフォルト値も正しく設定されているか確認
+    assert generator.config.layout.label_width == 105
 
 
-def test_grid_4up_layout():
+def test_grid_4up_layout(shibuya_to_osaka, save_pdf, yaml_config):
     """4丁付レイアウトのテスト"""
-    to_addr = AddressInfo(
-        postal_code="123-4567",
-        address1="東京都渋谷区XXX 1-2-3",
-        name="4丁付太郎",
-        phone="03-1234-5678",
-    )
-    from_addr = AddressInfo(
-        postal_code="987-6543",
-        address1="大阪府大阪市YYY 4-5-6",
-        name="4丁付花子",
-        phone="06-9876-5432",
-    )
+    to_addr, from_addr = shibuya_to_osaka
 
     # 4丁付レイアウトの設定を作成
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yaml") as tmp_config:
-        config_data = {"layout": {"layout_mode": "grid_4up"}}
-        yaml.dump(config_data, tmp_config)
-        config_path = tmp_config.name
+    config_path = yaml_config("layout:\n  layout_mode: grid_4up\n")
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-        output_path = tmp_pdf.name
+    # ファイルを介さずメモリ上に生成
+    buffer = io.BytesIO()
+    create_label(to_addr, from_addr, buffer, config_path=config_path)
+    result = buffer.getvalue()
+    assert result.startswith(b"%PDF-")
 
-    try:
-        result = create_label(to_addr, from_addr, output_path, config_path=config_path)
-        assert os.path.exists(result)
-        assert os.path.getsize(result) > 0
-
-        # CI環境用にPDFを保存
-        save_to_test_output(result)
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
-        if os.path.exists(config_path):
-            os.remove(config_path)
+    # CI環境用にPDFを保存
+    save_pdf(result)
 
 
 def test_center_layout_default():
@@ -365,7 +355,7 @@ def test_center_layout_default():
     assert config.layout.layout_mode == "center"
 
 
-def test_create_label_batch():
+def test_create_label_batch(save_pdf):
     """複数ラベルの一括生成テスト"""
     # テスト用の複数ラベルを作成
     label_pairs = [
@@ -416,141 +406,108 @@ def test_create_label_batch():
         ),
     ]
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-        output_path = tmp_pdf.name
+    from letterpack.label import create_label_batch
 
-    try:
-        from letterpack.label import create_label_batch
+    # ファイルを介さずメモリ上に生成
+    buffer = io.BytesIO()
+    create_label_batch(label_pairs, buffer)
+    result = buffer.getvalue()
+    assert result.startswith(b"%PDF-")
+
+    # CI環境用にPDFを保存
+    save_pdf(result)
 
-        result = create_label_batch(label_pairs, output_path)
-        assert os.path.exists(result)
-        assert os.path.getsize(result) > 0
 
-        # CI環境用にPDFを保存
-        save_to_test_output(result)
+def test_create_label_batch_5_labels(save_pdf):
+    """5件のラベルで2ページ生成のテスト"""
+    pdfium = pytest.importorskip("pypdfium2")
+    from letterpack.label import create_label_batch
+
+    # ファイルを介さずメモリ上に生成
+    buffer = io.BytesIO()
+    create_label_batch(list(_FIVE_PAIRS), buffer)
+    result = buffer.getvalue()
+    assert result.startswith(b"%PDF-")
+    # 4丁付なので5件は2ページになる
+    pdf = pdfium.PdfDocument(result)
+    try:
+        assert len(pdf) == 2
     finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
+        pdf.close()
 
+    # CI環境用にPDFを保存
+    save_pdf(result)
 
-def test_create_label_batch_5_labels():
-    """5件のラベルで2ページ生成のテスト"""
-    label_pairs = []
-    for i in range(5):
-        label_pairs.append(
-            (
-                AddressInfo(
-                    postal_code=f"{100 + i}-0001",
-                    address1=f"東京都千代田区{i}-{i}-{i}",
-                    name=f"テスト{i}",
-                    phone=f"03-0000-000{i}",
-                ),
-                AddressInfo(
-                    postal_code="999-9999",
-                    address1="送信元住所",
-                    name="送信元",
-                    phone="099-9999-9999",
-                ),
-            )
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_label_batch_parallel(workers, tmp_path):
+    """複数ラベルを個別PDFとして並列生成するテスト"""
+    from letterpack.label import create_labels_batch
+
+    from_addr = _SHARED_FROM
+    label_pairs = [
+        (
+            AddressInfo(
+                postal_code=f"{100 + i}-0001", address1=f"東京都千代田区{i}", name=f"並列{i}"
+            ),
+            from_addr,
         )
+        for i in range(8)
+    ]
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-        output_path = tmp_pdf.name
+    results = create_labels_batch(label_pairs, str(tmp_path / "labels"), workers=workers)
 
-    try:
-        from letterpack.label import create_label_batch
+    assert len(results) == 8
+    assert len(set(results)) == 8
+    for result in results:
+        # 存在しない場合はFileNotFoundErrorになるため、statの1回で存在とサイズを確認する
+        assert os.stat(result).st_size > 0
 
-        result = create_label_batch(label_pairs, output_path)
-        assert os.path.exists(result)
-        assert os.path.getsize(result) > 0
 
-        # CI環境用にPDFを保存
-        save_to_test_output(result)
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
+def test_font_registration_is_cached(monkeypatch):
+    """2つ目以降のLabelGeneratorではフォントの探索・再登録をしないことを確認"""
+    from reportlab.pdfbase import pdfmetrics
 
+    first = LabelGenerator()
+    calls = []
+    monkeypatch.setattr(pdfmetrics, "registerFont", calls.append)
+    monkeypatch.setattr(os.path, "exists", calls.append)
 
-def test_default_honorific_font_size():
-    """敬称フォントサイズのデフォルト値テスト（名前より2pt小さい）"""
-    config = load_layout_config(None)
-    # デフォルトではhonorificはNone
-    assert config.fonts.honorific is None
-    # 敬称が設定されている場合のレンダリングを確認
-    to_addr = AddressInfo(
-        postal_code="123-4567",
-        address1="東京都渋谷区XXX 1-2-3",
-        name="山田太郎",
-        phone="03-1234-5678",
-        honorific="様",
-    )
-    from_addr = AddressInfo(
-        postal_code="987-6543",
-        address1="大阪府大阪市YYY 4-5-6",
-        name="田中花子",
-        phone="06-9876-5432",
-    )
+    second = LabelGenerator()
+    assert calls == []
+    assert second.font_name == first.font_name
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-        output_path = tmp_file.name
 
-    try:
-        result = create_label(to_addr, from_addr, output_path)
-        assert os.path.exists(result)
-        assert os.path.getsize(result) > 0
+def test_address_splitting(shared_generator):
+    """住所の文字数による分割テスト"""
+    long_address = "東京都千代田区千代田1-1-1 サンプルビルディング12階 1201号室 テスト株式会社"
+    result = shared_generator._split_address(long_address, max_length=10)
+    assert "".join(result) == long_address
+    assert all(len(line) <= 10 for line in result)
+    assert len(result) == -(-len(long_address) // 10)
 
-        # CI環境用にPDFを保存
-        save_to_test_output(result)
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
+    assert shared_generator._split_address("短い住所", max_length=10) == ["短い住所"]
+    assert shared_generator._split_address("", max_length=10) == [""]
 
 
-def test_custom_honorific_font_size():
+def test_custom_honorific_font_size(shibuya_to_osaka_sama, save_pdf, yaml_config):
     """敬称フォントサイズの指定テスト"""
     # カスタム設定ファイルを作成（敬称を10ptに指定）
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yaml") as tmp_config:
-        config_data = {
-            "fonts": {"name": 14, "honorific": 10},
-        }
-        yaml.dump(config_data, tmp_config)
-        config_path = tmp_config.name
-
-    try:
-        config = load_layout_config(config_path)
-        assert config.fonts.name == 14
-        assert config.fonts.honorific == 10
-
-        to_addr = AddressInfo(
-            postal_code="123-4567",
-            address1="東京都渋谷区XXX 1-2-3",
-            name="山田太郎",
-            phone="03-1234-5678",
-            honorific="様",
-        )
-        from_addr = AddressInfo(
-            postal_code="987-6543",
-            address1="大阪府大阪市YYY 4-5-6",
-            name="田中花子",
-            phone="06-9876-5432",
-        )
+    config_path = yaml_config("fonts:\n  name: 14\n  honorific: 10\n")
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-            output_path = tmp_pdf.name
+    config = load_layout_config(config_path)
+    assert config.fonts.name == 14
+    assert config.fonts.honorific == 10
 
-        try:
-            result = create_label(to_addr, from_addr, output_path, config_path=config_path)
-            assert os.path.exists(result)
-            assert os.path.getsize(result) > 0
+    to_addr, from_addr = shibuya_to_osaka_sama
+    # ファイルを介さずメモリ上に生成
+    buffer = io.BytesIO()
+    create_label(to_addr, from_addr, buffer, config_path=config_path)
+    result = buffer.getvalue()
+    assert result.startswith(b"%PDF-")
 
-            # CI環境用にPDFを保存
-            save_to_test_output(result)
-        finally:
-            if os.path.exists(output_path):
-                os.remove(output_path)
-    finally:
-        if os.path.exists(config_path):
-            os.remove(config_path)
+    # CI環境用にPDFを保存
+    save_pdf(result)
 
 
 def test_load_config_from_dict():
@@ -582,59 +539,36 @@ def test_load_config_from_empty_dict():
     assert config.layout.label_width == 105  # デフォルト値
 
 
-def test_label_generation_with_config_dict():
+def test_label_generation_with_config_dict(shibuya_to_osaka, save_pdf):
     """辞書設定を使用したラベル生成のテスト"""
     config_dict = {
         "fonts": {"name": 18, "address": 14},
         "layout": {"draw_border": True},
     }
 
-    to_addr = AddressInfo(
-        postal_code="123-4567",
-        address1="東京都渋谷区XXX 1-2-3",
-        name="山田太郎",
-        phone="03-1234-5678",
-    )
-    from_addr = AddressInfo(
-        postal_code="987-6543",
-        address1="大阪府大阪市YYY 4-5-6",
-        name="田中花子",
-        phone="06-9876-5432",
-    )
-
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-        output_path = tmp_pdf.name
+    to_addr, from_addr = shibuya_to_osaka
 
-    try:
-        result = create_label(to_addr, from_addr, output_path, config_dict=config_dict)
-        assert os.path.exists(result)
-        assert os.path.getsize(result) > 0
+    # ファイルを介さずメモリ上に生成
+    buffer = io.BytesIO()
+    create_label(to_addr, from_addr, buffer, config_dict=config_dict)
+    result = buffer.getvalue()
+    assert result.startswith(b"%PDF-")
 
-        # CI環境用にPDFを保存
-        save_to_test_output(result)
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
+    # CI環境用にPDFを保存
+    save_pdf(result)
 
 
-def test_config_dict_priority_over_path():
+def test_config_dict_priority_over_path(yaml_config):
     """config_dictとconfig_pathが両方指定された場合、config_dictが優先されることをテスト"""
     # ファイル設定を作成
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yaml") as tmp_config:
-        file_config = {"fonts": {"name": 10}}
-        yaml.dump(file_config, tmp_config)
-        config_path = tmp_config.name
+    config_path = yaml_config("fonts:\n  name: 10\n")
 
-    try:
-        # 辞書設定（こちらが優先されるべき）
-        dict_config = {"fonts": {"name": 20}}
+    # 辞書設定（こちらが優先されるべき）
+    dict_config = {"fonts": {"name": 20}}
 
-        config = load_layout_config(config_path=config_path, config_dict=dict_config)
-        # 辞書設定が優先される
-        assert config.fonts.name == 20
-    finally:
-        if os.path.exists(config_path):
-            os.remove(config_path)
+    config = load_layout_config(config_path=config_path, config_dict=dict_config)
+    # 辞書設定が優先される
+    assert config.fonts.name == 20
 
 
 # レビュー指摘のテストケース
@@ -682,10 +616,9 @@ def test_section_height_validation_failure():
         load_layout_config(config_dict=config_dict)
 
 
-def test_config_dict_replaces_yaml_file(tmp_path):
+def test_config_dict_replaces_yaml_file(yaml_config):
     """config_dictが指定された場合、config_pathのYAMLファイルは無視されることを確認"""
-    yaml_config = tmp_path / "test_config.yaml"
-    yaml_config.write_text(
+    config_path = yaml_config(
         """
 layout:
   label_width: 100
@@ -700,7 +633,7 @@ fonts:
         "fonts": {"name": 18}  # nameのみ上書き
     }
 
-    config = load_layout_config(config_path=str(yaml_config), config_dict=config_dict)
+    config = load_layout_config(config_path=config_path, config_dict=config_dict)
 
     # config_dictで指定したものが反映
     assert config.fonts.name == 18
@@ -710,6 +643,90 @@ fonts:
     assert config.fonts.address == 11  # デフォルト値
 
 
+def test_load_config_is_cached(tmp_path, monkeypatch):
+    """同じ設定ファイルの再読み込みはキャッシュされ、書き換えると再パースされることを確認"""
+    config_path = tmp_path / "cached_config.yaml"
+    config_path.write_text("fonts:\n  name: 16\n", encoding="utf-8")
+
+    first = load_layout_config(str(config_path))
+    # 2回目はプロセス内キャッシュから返され、YAMLもJSONキャッシュも読まない
+    monkeypatch.setattr(
+        "letterpack.label._read_layout_cache", lambda *args: pytest.fail("cache was read")
+    )
+    monkeypatch.setattr("yaml.load", lambda *args, **kwargs: pytest.fail("YAML was parsed"))
+    assert load_layout_config(str(config_path)) is first
+    monkeypatch.undo()
+
+    # 書き換えるとサイズ・更新時刻が変わるため、キャッシュを破棄しなくても新しい内容が読み込まれる
+    config_path.write_text("fonts:\n  name: 20\n  address: 12\n", encoding="utf-8")
+    second = load_layout_config(str(config_path))
+    assert first.fonts.name == 16
+    assert (second.fonts.name, second.fonts.address) == (20, 12)
+
+
+def test_config_dict_validation_is_cached():
+    """同じ内容の設定辞書は検証済みの不変インスタンスを共有することを確認"""
+    config_dict = {"fonts": {"name": 18, "address": 14}, "layout": {"draw_border": True}}
+
+    first = load_layout_config(config_dict=config_dict)
+    second = load_layout_config(config_dict={**config_dict})
+    assert first is second
+
+    with pytest.raises(ValidationError):
+        first.fonts.name = 20
+
+    # キャッシュを破棄すると検証し直される
+    clear_layout_cache()
+    assert load_layout_config(config_dict=config_dict) is not first
+
+
+def test_load_config_uses_json_sidecar(tmp_path, monkeypatch):
+    """パース結果がJSONキャッシュに保存され、次回以降はYAMLをパースしないことを確認"""
+    config_path = tmp_path / "sidecar_config.yaml"
+    config_path.write_text("fonts:\n  name: 17\n", encoding="utf-8")
+
+    load_layout_config(str(config_path))
+    # 書き込みに使った一時ファイルは残らない
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "sidecar_config.yaml",
+        "sidecar_config.yaml.cache.json",
+    ]
+
+    # プロセス内キャッシュを破棄しても、JSONキャッシュから読み込まれる
+    clear_layout_cache()
+    monkeypatch.setattr("yaml.load", lambda *args, **kwargs: pytest.fail("YAML was parsed"))
+    assert load_layout_config(str(config_path)).fonts.name == 17
+
+    # 内容が同じなら更新時刻だけが変わっても（git checkoutなど）JSONキャッシュを使う
+    st = os.stat(config_path)
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert load_layout_config(str(config_path)).fonts.name == 17
+    monkeypatch.undo()
+
+    # YAMLが書き換えられた場合はキャッシュを使わない
+    config_path.write_text("fonts:\n  name: 21\n  address: 12\n", encoding="utf-8")
+    clear_layout_cache()
+    assert load_layout_config(str(config_path)).fonts.address == 12
+
+
+@pytest.mark.parametrize("failing", ["tempfile.mkstemp", "os.replace"])
+def test_load_config_when_sidecar_cannot_be_written(tmp_path, monkeypatch, failing):
+    """JSONキャッシュを書き込めない場合（読み取り専用のディレクトリなど）も設定を読み込めることを確認"""
+    config_path = tmp_path / "readonly_config.yaml"
+    config_path.write_text("fonts:\n  name: 19\n", encoding="utf-8")
+
+    # rootで実行するとchmodでは書き込みを禁止できないため、書き込み処理を失敗させる
+    def _raise(*args, **kwargs):
+        raise PermissionError("read-only directory")
+
+    monkeypatch.setattr(failing, _raise)
+    assert load_layout_config(str(config_path)).fonts.name == 19
+    monkeypatch.undo()
+
+    # キャッシュも書きかけの一時ファイルも残らない
+    assert [p.name for p in tmp_path.iterdir()] == ["readonly_config.yaml"]
+
+
 def test_invalid_label_width_raises_error():
     """不正なlabel_widthでValidationError"""
     config_dict = {
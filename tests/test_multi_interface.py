@@ -5,23 +5,32 @@
 ラベルPDFを生成し、一貫性を検証します。
 """
 
+import contextlib
+import dataclasses
 import difflib
+import functools
 import importlib.util
 import os
+import socket
 import subprocess
+import threading
 import time
+import tracemalloc
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 
 import pytest
 
+from letterpack.cli import main as cli_main
 from letterpack.csv_parser import parse_csv
-from letterpack.label import AddressInfo, create_label_batch
+from letterpack.label import AddressInfo, create_label, create_label_batch
 
 try:
-    from PyPDF2 import PdfReader
+    import pypdfium2 as pdfium
 
-    HAS_PYPDF2 = True
+    HAS_PDFIUM = True
 except ImportError:
-    HAS_PYPDF2 = False
+    HAS_PDFIUM = False
 
 try:
     import pdfplumber
@@ -31,22 +40,79 @@ except ImportError:
     HAS_PDFPLUMBER = False
 
 try:
-    import requests
+    from rapidfuzz import fuzz
 
-    HAS_REQUESTS = True
+    HAS_RAPIDFUZZ = True
 except ImportError:
-    HAS_REQUESTS = False
+    HAS_RAPIDFUZZ = False
 
 try:
-    import psutil
+    import requests
 
-    HAS_PSUTIL = True
+    HAS_REQUESTS = True
 except ImportError:
-    HAS_PSUTIL = False
+    HAS_REQUESTS = False
 
 # Playwrightの利用可能性をチェック（インポートせずにモジュールの存在を確認）
 HAS_PLAYWRIGHT = importlib.util.find_spec("playwright") is not None
 
+# サーバーを使うテストはpytest-xdistで同じワーカーにまとめ、モジュールスコープのサーバーを
+# 1回の起動で共有する（それ以外のテストは他のワーカーに分散できる）
+uses_servers = pytest.mark.xdist_group("multi_interface_servers")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_pdf(pdf_path: str, mtime_ns: int, size: int) -> tuple[tuple[str, ...], tuple[list, ...]]:
+    """
+    pdfplumberでPDFを1回だけ開き、ページごとのテキストと文字情報をまとめて取り出す
+
+    キャッシュキーに更新時刻とサイズを含めるため、PDFが再生成されると自動的に読み直す。
+
+    Args:
+        pdf_path: PDFファイルの絶対パス
+        mtime_ns: PDFファイルの更新時刻（ナノ秒）
+        size: PDFファイルのサイズ
+
+    Returns:
+        (ページごとのテキスト, ページごとの文字情報のリスト)
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        texts = tuple(page.extract_text() or "" for page in pdf.pages)
+        chars = tuple(page.chars for page in pdf.pages)
+    return texts, chars
+
+
+def _read_pdf(pdf_path: str) -> tuple[tuple[str, ...], tuple[list, ...]]:
+    """PDFのテキストと文字情報を取得（同じPDFは1回だけパースする）"""
+    st = os.stat(pdf_path)
+    return _load_pdf(os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size)
+
+
+# レイアウト位置の比較に使うキーワードと、キーワードに含まれる文字 → キーワードの対応表
+# （「お」のように複数のキーワードに含まれる文字もあるため、値はタプルにする）
+_LAYOUT_KEYWORDS = ("おところ", "おなまえ", "電話番号", "〒")
+_GLYPH_TO_KEYWORDS: dict[str, tuple[str, ...]] = {}
+for _keyword in _LAYOUT_KEYWORDS:
+    for _glyph in dict.fromkeys(_keyword):
+        _GLYPH_TO_KEYWORDS[_glyph] = (*_GLYPH_TO_KEYWORDS.get(_glyph, ()), _keyword)
+
+
+# mm -> pt変換（1mm = 2.83pt）
+_PT_PER_MM = 2.83
+
+
+def _text_similarity(text1: str, text2: str) -> float:
+    """
+    2つのテキストの類似度を計算（0.0〜1.0）
+
+    rapidfuzzがあればC++実装を使い、なければdifflibで計算する。
+    difflibは既定のautojunkだと「おなまえ」などの繰り返し出現する文字を
+    ジャンク扱いして類似度が不正確になるため、autojunk=Falseで比較する。
+    """
+    if HAS_RAPIDFUZZ:
+        return fuzz.ratio(text1, text2) / 100.0
+    return difflib.SequenceMatcher(None, text1, text2, autojunk=False).ratio()
+
 
 class PDFValidator:
     """PDFの基本情報を検証するクラス"""
@@ -54,12 +120,21 @@ class PDFValidator:
     @staticmethod
     def get_page_count(pdf_path: str) -> int | None:
         """PDFのページ数を取得"""
-        if not HAS_PYPDF2:
+        if HAS_PDFIUM:
+            # PDFium（C実装）はページツリーを数えるだけで、文字情報までは解析しない
+            try:
+                pdf = pdfium.PdfDocument(pdf_path)
+            except Exception:
+                return None
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+        if not HAS_PDFPLUMBER:
             return None
         try:
-            with open(pdf_path, "rb") as f:
-                pdf = PdfReader(f)
-                return len(pdf.pages)
+            texts, _ = _read_pdf(pdf_path)
+            return len(texts)
         except Exception:
             return None
 
@@ -74,13 +149,26 @@ class PDFValidator:
         if not HAS_PDFPLUMBER:
             return None
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                text_content = ""
-                for page in pdf.pages:
-                    text_content += page.extract_text() or ""
-                return text_content
+            texts, _ = _read_pdf(pdf_path)
+            return "".join(texts)
+        except Exception:
+            return None
+
+    @staticmethod
+    def summarize(pdf_path: str) -> dict | None:
+        """PDFのファイルサイズ・ページ数・テキストを1回のstatと1回のパースでまとめて取得
+
+        Returns:
+            {"size", "pages", "text"} の辞書、pdfplumberがない場合はNone
+        """
+        if not HAS_PDFPLUMBER:
+            return None
+        try:
+            st = os.stat(pdf_path)
+            texts, _ = _load_pdf(os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size)
         except Exception:
             return None
+        return {"size": st.st_size, "pages": len(texts), "text": "".join(texts)}
 
     @staticmethod
     def compare_text_content(pdf_path1: str, pdf_path2: str) -> dict | None:
@@ -97,45 +185,43 @@ class PDFValidator:
             return None
 
         try:
-            with pdfplumber.open(pdf_path1) as pdf1, pdfplumber.open(pdf_path2) as pdf2:
-                results = {
-                    "page_count_match": len(pdf1.pages) == len(pdf2.pages),
-                    "page_count_1": len(pdf1.pages),
-                    "page_count_2": len(pdf2.pages),
-                    "pages": [],
-                    "overall_similarity": 0.0,
-                }
-
-                total_similarity = 0.0
-                page_count = min(len(pdf1.pages), len(pdf2.pages))
-
-                for i in range(page_count):
-                    text1 = pdf1.pages[i].extract_text() or ""
-                    text2 = pdf2.pages[i].extract_text() or ""
-
-                    # 類似度を計算（0.0〜1.0）
-                    similarity = difflib.SequenceMatcher(None, text1, text2).ratio()
-                    total_similarity += similarity
+            texts1, _ = _read_pdf(pdf_path1)
+            texts2, _ = _read_pdf(pdf_path2)
+        except Exception:
+            return None
 
-                    results["pages"].append(
-                        {
-                            "page": i + 1,
-                            "similarity": round(similarity, 4),
-                            "text1_length": len(text1),
-                            "text2_length": len(text2),
-                            "text1_preview": text1[:100],
-                            "text2_preview": text2[:100],
-                        }
-                    )
+        results = {
+            "page_count_match": len(texts1) == len(texts2),
+            "page_count_1": len(texts1),
+            "page_count_2": len(texts2),
+            "pages": [],
+            "overall_similarity": 0.0,
+        }
 
-                # 全体の平均類似度を計算
-                if page_count > 0:
-                    results["overall_similarity"] = round(total_similarity / page_count, 4)
+        total_similarity = 0.0
+        page_count = min(len(texts1), len(texts2))
+
+        for i, (text1, text2) in enumerate(zip(texts1, texts2, strict=False)):
+            # 類似度を計算（0.0〜1.0）
+            similarity = _text_similarity(text1, text2)
+            total_similarity += similarity
+
+            results["pages"].append(
+                {
+                    "page": i + 1,
+                    "similarity": round(similarity, 4),
+                    "text1_length": len(text1),
+                    "text2_length": len(text2),
+                    "text1_preview": text1[:100],
+                    "text2_preview": text2[:100],
+                }
+            )
 
-                return results
+        # 全体の平均類似度を計算
+        if page_count > 0:
+            results["overall_similarity"] = round(total_similarity / page_count, 4)
 
-        except Exception:
-            return None
+        return results
 
     @staticmethod
     def extract_layout_positions(pdf_path: str) -> dict | None:
@@ -152,30 +238,28 @@ class PDFValidator:
 
         try:
             positions = {}
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    # 文字レベルの座標を取得
-                    chars = page.chars
-
-                    # 特定のキーワードの位置を検索
-                    keywords = ["おところ", "おなまえ", "電話番号", "〒"]
-                    for keyword in keywords:
-                        # keywordを含む文字を検索
-                        found = False
-                        for char in chars:
-                            text = char.get("text", "")
-                            if keyword in text or text in keyword:
-                                key = f"{keyword}_page{page_num}"
-                                if key not in positions:  # 最初に見つかったものを記録
-                                    positions[key] = {
-                                        "x": round(char["x0"], 2),
-                                        "y": round(char["top"], 2),
-                                        "text": text,
-                                    }
-                                    found = True
-                                    break
-                        if found:
-                            continue
+            _, pages_chars = _read_pdf(pdf_path)
+            # ページごとの文字レベルの座標を1回だけ走査し、各キーワードに含まれる
+            # 最初の文字の位置を記録する
+            for page_num, chars in enumerate(pages_chars):
+                remaining = set(_LAYOUT_KEYWORDS)
+                for char in chars:
+                    text = char.get("text", "")
+                    if len(text) == 1:
+                        matched = _GLYPH_TO_KEYWORDS.get(text, ())
+                    else:
+                        # 合字などの複数文字・空文字は部分文字列で判定する
+                        matched = [kw for kw in _LAYOUT_KEYWORDS if kw in text or text in kw]
+                    for keyword in matched:
+                        if keyword in remaining:
+                            positions[f"{keyword}_page{page_num}"] = {
+                                "x": round(char["x0"], 2),
+                                "y": round(char["top"], 2),
+                                "text": text,
+                            }
+                            remaining.discard(keyword)
+                    if not remaining:
+                        break
 
             return positions
 
@@ -196,20 +280,23 @@ class PDFValidator:
         Returns:
             比較結果の辞書（各要素が許容範囲内かどうか）
         """
-        # mm -> pt変換（1mm = 2.83pt）
-        tolerance_pt = tolerance_mm * 2.83
+        tolerance_pt = tolerance_mm * _PT_PER_MM
 
         results = {
             "all_within_tolerance": True,
             "details": {},
         }
 
-        # pos1とpos2の共通キーについて比較
-        common_keys = set(pos1.keys()) & set(pos2.keys())
+        # キーの集合演算は1回だけ行う（dictのキービューはそのまま集合演算できる）
+        keys1, keys2 = pos1.keys(), pos2.keys()
+        only_in_pos1 = keys1 - keys2
+        only_in_pos2 = keys2 - keys1
 
-        for key in common_keys:
-            x_diff = abs(pos1[key]["x"] - pos2[key]["x"])
-            y_diff = abs(pos1[key]["y"] - pos2[key]["y"])
+        # pos1とpos2の共通キーについて比較
+        for key in keys1 & keys2:
+            p1, p2 = pos1[key], pos2[key]
+            x_diff = abs(p1["x"] - p2["x"])
+            y_diff = abs(p1["y"] - p2["y"])
 
             within_tolerance = x_diff <= tolerance_pt and y_diff <= tolerance_pt
 
@@ -217,17 +304,14 @@ class PDFValidator:
                 "within_tolerance": within_tolerance,
                 "x_diff": round(x_diff, 2),
                 "y_diff": round(y_diff, 2),
-                "pos1": pos1[key],
-                "pos2": pos2[key],
+                "pos1": p1,
+                "pos2": p2,
             }
 
             if not within_tolerance:
                 results["all_within_tolerance"] = False
 
         # pos1のみまたはpos2のみに存在するキーをチェック
-        only_in_pos1 = set(pos1.keys()) - set(pos2.keys())
-        only_in_pos2 = set(pos2.keys()) - set(pos1.keys())
-
         if only_in_pos1 or only_in_pos2:
             results["all_within_tolerance"] = False
             results["only_in_pos1"] = list(only_in_pos1)
@@ -236,10 +320,10 @@ class PDFValidator:
         return results
 
 
-@pytest.fixture
-def test_csv_data(tmp_path):
-    """テスト用CSVデータを準備"""
-    csv_path = tmp_path / "test_multi_interface.csv"
+@pytest.fixture(scope="session")
+def test_csv_data(tmp_path_factory):
+    """テスト用CSVデータを準備（内容は固定のため、セッション内で1回だけ書き出す）"""
+    csv_path = tmp_path_factory.mktemp("csv") / "test_multi_interface.csv"
     csv_content = """to_postal,to_address1,to_name,to_phone,to_honorific,from_postal,from_address1,from_name,from_phone,from_honorific
 100-0001,東京都千代田区千代田1-1,山田太郎,03-1234-5678,様,150-0001,東京都渋谷区渋谷1-1,佐藤花子,03-9876-5432,
 200-0002,大阪府大阪市中央区2-2,鈴木次郎,06-1111-2222,殿,150-0001,東京都渋谷区渋谷1-1,佐藤花子,03-9876-5432,
@@ -249,6 +333,39 @@ def test_csv_data(tmp_path):
     return csv_path
 
 
+@dataclasses.dataclass(frozen=True)
+class CLIGeneratedPDF:
+    """CLI版で生成したPDFと、その検証用情報"""
+
+    path: Path
+    seconds: float
+    size: int
+    pages: int | None
+    text: str | None
+
+
+@pytest.fixture(scope="session")
+def cli_pdf(test_csv_data, tmp_path_factory) -> CLIGeneratedPDF:
+    """CLI版でテスト用CSVから生成したPDF（生成したPDFを読むだけのテストで共有する）
+
+    同じ入力からは同じPDFが生成されるため、CLIの実行とPDFの解析はセッション内で1回だけ行う。
+    """
+    output_pdf = tmp_path_factory.mktemp("reference") / "cli_reference.pdf"
+    start_time = time.perf_counter()
+    assert cli_main(["--csv", str(test_csv_data), "--output", str(output_pdf)]) == 0
+    seconds = time.perf_counter() - start_time
+
+    info = PDFValidator.summarize(str(output_pdf))
+    if info is None:
+        # pdfplumberがない場合はテキストなしでページ数だけ取得する
+        info = {
+            "size": PDFValidator.get_file_size(str(output_pdf)),
+            "pages": PDFValidator.get_page_count(str(output_pdf)),
+            "text": None,
+        }
+    return CLIGeneratedPDF(path=output_pdf, seconds=seconds, **info)
+
+
 @pytest.fixture
 def output_dir(tmp_path):
     """テスト結果を保存するディレクトリ"""
@@ -257,10 +374,205 @@ def output_dir(tmp_path):
     return output_path
 
 
-@pytest.fixture
+def _free_port() -> int:
+    """OSに空いているポート番号を割り当ててもらう"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
 def test_server_port():
-    """テスト用Webサーバーのポート番号を取得（環境変数またはデフォルト値）"""
-    return int(os.environ.get("TEST_SERVER_PORT", "5000"))
+    """テスト用Webサーバーのポート番号を取得（環境変数、未指定なら空きポート）"""
+    port = os.environ.get("TEST_SERVER_PORT")
+    return int(port) if port else _free_port()
+
+
+def _stop_process(process: subprocess.Popen) -> None:
+    """サーバープロセスを終了する（応答しない場合は強制終了）"""
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def _wait_for_port(process: subprocess.Popen, port: int, timeout: float = 10.0) -> None:
+    """サーバーが指定ポートで接続を受け付けるまで待機する（固定時間のsleepの代わりにポーリング）"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            pytest.fail(f"Server process exited with code {process.returncode}")
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.05)
+    pytest.fail(f"Server did not start listening on port {port} within {timeout}s")
+
+
+@contextlib.contextmanager
+def _run_server(command: list[str], port: int):
+    """サーバープロセスを起動し、接続を受け付けるようになったらベースURLを返す"""
+    # 出力は読まないため、長時間動かしてもパイプが詰まらないよう破棄する
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_for_port(process, port)
+        yield f"http://localhost:{port}"
+    finally:
+        _stop_process(process)
+
+
+@pytest.fixture(scope="module")
+def web_server(test_server_port):
+    """モジュール内のテストで共有するWebサーバー（起動は1回だけ）"""
+    with _run_server(
+        ["python", "-m", "letterpack.web", "--port", str(test_server_port)], test_server_port
+    ) as base_url:
+        yield base_url
+
+
+@pytest.fixture(scope="module")
+def web_session(web_server):
+    """Webサーバーへのリクエストで共有するセッション（keep-aliveで接続を再利用する）"""
+    with requests.Session() as session:
+        yield session
+
+
+# 静的HTML版（index_static.html）を配信するプロジェクトルート
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class _QuietHTTPRequestHandler(SimpleHTTPRequestHandler):
+    """リクエストごとのアクセスログを出力しない静的ファイル配信ハンドラ"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def web_pdf(test_csv_data, web_server, web_session, tmp_path_factory):
+    """Webサーバー版でテスト用CSVから生成したPDF（Webのテストと一貫性テストで共有する）"""
+    output_pdf = tmp_path_factory.mktemp("web") / "web_output.pdf"
+    return _generate_pdf_with_web(web_session, test_csv_data, output_pdf, web_server)
+
+
+@pytest.fixture(scope="module")
+def http_server():
+    """静的HTML版を配信するHTTPサーバー（モジュール内のテストで共有する）
+
+    別のインタープリタを起動せず、バックグラウンドスレッドでプロセス内に立ち上げる。
+    """
+    handler = functools.partial(_QuietHTTPRequestHandler, directory=str(PROJECT_ROOT))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope="module")
+def chromium_browser():
+    """モジュール内のPlaywrightテストで共有するヘッドレスChromium（起動は1回だけ）"""
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        yield browser
+        browser.close()
+
+
+@pytest.fixture
+def browser_page(chromium_browser):
+    """テストごとに新しいブラウザコンテキストで開いたページ（Cookieなどはテスト間で共有しない）"""
+    context = chromium_browser.new_context()
+    page = context.new_page()
+    yield page
+    context.close()
+
+
+# フォームの各入力欄に値を設定するスクリプト（全項目を1回のブラウザ呼び出しで入力する）
+_FILL_FORM_JS = """(values) => {
+    for (const [id, value] of Object.entries(values)) {
+        const input = document.getElementById(id);
+        input.value = value;
+        input.dispatchEvent(new Event("input", { bubbles: true }));
+    }
+}"""
+
+
+def _fill_form_from_csv(page, csv_path) -> None:
+    """CSVの1行目のデータを静的HTML版のフォームに入力する"""
+    label = parse_csv(str(csv_path))[0]
+    values = {}
+    for prefix, address in (("to", label.to_address), ("from", label.from_address)):
+        values[f"{prefix}_postal"] = address.postal_code
+        values[f"{prefix}_address1"] = address.address1
+        values[f"{prefix}_name"] = address.name
+        values[f"{prefix}_phone"] = address.phone or ""
+    page.evaluate(_FILL_FORM_JS, values)
+
+
+def _generate_pdf_with_web(session, csv_path, output_pdf, base_url: str):
+    """Webサーバー版でCSVからPDFを生成"""
+    with open(csv_path, "rb") as f:
+        files = {"csv_file": f}
+        response = session.post(f"{base_url}/generate_csv", files=files, timeout=10, stream=True)
+
+    # レスポンス全体をメモリに載せず、チャンクごとにファイルへ書き出す
+    with response:
+        assert response.status_code == 200, (
+            f"Web API failed with status {response.status_code}: {response.text}"
+        )
+        chunks = response.iter_content(chunk_size=64 * 1024)
+        head = next(chunks, b"")
+        # エラー時はフォームにリダイレクトされ200でHTMLが返るため、PDFであることも確認する
+        assert head.startswith(b"%PDF-"), "Web API did not return a PDF"
+        with open(output_pdf, "wb") as out:
+            out.write(head)
+            for chunk in chunks:
+                out.write(chunk)
+    return output_pdf
+
+
+def _generate_pdf_with_static_html(page, csv_path, output_pdf, base_url: str):
+    """静的HTML版でCSVの1行目からPDFを生成"""
+    # 静的HTML版を開く
+    page.goto(f"{base_url}/index_static.html")
+
+    # Pyodideの初期化を待つ（最大90秒）
+    page.wait_for_selector("#label-form", timeout=90000)
+
+    _fill_form_from_csv(page, csv_path)
+
+    # PDF生成ボタンをクリックしてダウンロードを待機
+    with page.expect_download(timeout=30000) as download_info:
+        page.click("#generate-btn")
+        download = download_info.value
+
+    download.save_as(str(output_pdf))
+
+    assert output_pdf.exists(), "PDF not generated"
+    return output_pdf
+
+
+def _pdf_meta(pdf_path) -> tuple[int, int | None]:
+    """PDFのファイルサイズとページ数を取得（ページ数が取れない場合はNone）"""
+    return os.stat(pdf_path).st_size, PDFValidator.get_page_count(str(pdf_path))
+
+
+def _generate_pdf_pair(csv_path, pdf1, pdf2) -> None:
+    """同じCSVから2つのPDFをプロセス内で生成（決定性の比較用）
+
+    CSVの解析は1回だけ行い、同じラベルペアから create_label_batch を2回呼び出します。
+    """
+    labels = parse_csv(str(csv_path))
+    label_pairs = [(label.to_address, label.from_address) for label in labels]
+    for pdf_path in (pdf1, pdf2):
+        create_label_batch(label_pairs, str(pdf_path))
+        assert pdf_path.exists()
 
 
 class TestCLIInterface:
@@ -270,7 +582,8 @@ class TestCLIInterface:
         """CLI版でCSVからPDF生成"""
         output_pdf = output_dir / "cli_output.pdf"
 
-        # CLIを実行
+        # CLIを実行（python -m letterpack.cliとしての起動を確認するため、このテストのみ別プロセスで実行する。
+        # 他のテストはインタープリタ起動のコストを省くためcli_mainをプロセス内で呼び出す）
         result = subprocess.run(
             [
                 "python",
@@ -293,178 +606,49 @@ class TestCLIInterface:
         assert output_pdf.exists(), "PDF was not generated"
         assert output_pdf.stat().st_size > 0, "PDF file is empty"
 
-    def test_cli_pdf_structure(self, test_csv_data, output_dir):
+    def test_cli_pdf_structure(self, cli_pdf):
         """CLI生成PDFの構造確認"""
-        output_pdf = output_dir / "cli_structure.pdf"
-
-        subprocess.run(
-            [
-                "python",
-                "-m",
-                "letterpack.cli",
-                "--csv",
-                str(test_csv_data),
-                "--output",
-                str(output_pdf),
-            ],
-            capture_output=True,
-            text=True,
-        )
-
         # ページ数を確認
-        page_count = PDFValidator.get_page_count(str(output_pdf))
+        page_count = cli_pdf.pages
         if page_count is not None:
             # 3件のデータ（4upレイアウトなので1ページ）
             assert page_count >= 1, f"Expected at least 1 page, got {page_count}"
 
 
+@uses_servers
 class TestWebServerInterface:
     """Webサーバー版のテスト"""
 
-    def test_web_server_api_available(self, test_server_port):
+    def test_web_server_api_available(self, web_server, test_server_port):
         """Webサーバーが起動可能か確認"""
-        # Webサーバーを起動
-        server_process = subprocess.Popen(
-            ["python", "-m", "letterpack.web"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-
-        # サーバーの起動を待機
-        time.sleep(2)
-
-        try:
-            # ポートが開いているか確認（簡易チェック）
-            import socket
-
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # ポートが開いているか確認（簡易チェック）
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
             result = sock.connect_ex(("127.0.0.1", test_server_port))
-            assert result == 0, f"Web server is not responding on port {test_server_port}"
-            sock.close()
-        finally:
-            server_process.terminate()
-            try:
-                server_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                server_process.kill()
+        assert result == 0, f"Web server is not responding on port {test_server_port}"
 
     @pytest.mark.skipif(not HAS_REQUESTS, reason="requests library not installed")
-    def test_web_generate_from_csv(self, test_csv_data, output_dir, test_server_port):
+    def test_web_generate_from_csv(self, web_pdf):
         """Webサーバー版でCSVからPDF生成
 
         このテストはrequestsライブラリが必要です。
         """
-        output_pdf = output_dir / "web_output.pdf"
-
-        # Webサーバーを起動
-        server_process = subprocess.Popen(
-            ["python", "-m", "letterpack.web"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        try:
-            # サーバーの起動を待機
-            time.sleep(2)
-
-            # CSVファイルをアップロード
-            with open(test_csv_data, "rb") as f:
-                files = {"csv_file": f}
-                response = requests.post(
-                    f"http://localhost:{test_server_port}/generate",
-                    files=files,
-                    timeout=10,
-                )
-
-            assert response.status_code == 200, (
-                f"Web API failed with status {response.status_code}: {response.text}"
-            )
-
-            # PDFを保存
-            output_pdf.write_bytes(response.content)
-            assert output_pdf.exists(), "PDF not generated"
-
-        finally:
-            server_process.terminate()
-            try:
-                server_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                server_process.kill()
+        assert web_pdf.exists(), "PDF not generated"
 
 
+@uses_servers
 class TestStaticHTMLInterface:
     """静的HTML版（Pyodide）のテスト"""
 
     @pytest.mark.skipif(not HAS_PLAYWRIGHT, reason="Playwright not installed")
-    def test_static_html_generate(self, test_csv_data, output_dir):
+    def test_static_html_generate(self, test_csv_data, output_dir, http_server, browser_page):
         """静的HTML版でCSVからPDF生成
 
         このテストはPlaywrightが必要です。
         """
-        from playwright.sync_api import sync_playwright
-
-        output_pdf = output_dir / "static_output.pdf"
-
-        # HTTPサーバーを起動
-        server_process = subprocess.Popen(
-            ["python", "-m", "http.server", "8888"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        output_pdf = _generate_pdf_with_static_html(
+            browser_page, test_csv_data, output_dir / "static_output.pdf", http_server
         )
-
-        try:
-            # サーバーの起動を待機
-            time.sleep(2)
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                # 静的HTML版を開く
-                page.goto("http://localhost:8888/index_static.html")
-
-                # Pyodideの初期化を待つ（最大90秒）
-                page.wait_for_selector("#label-form", timeout=90000)
-
-                # CSVデータを読み込んで1行目のデータを使用
-                with open(test_csv_data, encoding="utf-8") as f:
-                    lines = f.readlines()
-                    # ヘッダーをスキップして1行目のデータを取得
-                    if len(lines) > 1:
-                        data_line = lines[1].strip().split(",")
-                        # to_postal,to_address,to_name,to_phone,to_honorific,from_postal,...
-                        if len(data_line) >= 10:
-                            # フォームに入力
-                            page.fill("#to_postal", data_line[0])
-                            page.fill("#to_address1", data_line[1])
-                            page.fill("#to_name", data_line[2])
-                            page.fill("#to_phone", data_line[3])
-
-                            page.fill("#from_postal", data_line[5])
-                            page.fill("#from_address1", data_line[6])
-                            page.fill("#from_name", data_line[7])
-                            page.fill("#from_phone", data_line[8])
-
-                # PDF生成ボタンをクリックしてダウンロードを待機
-                with page.expect_download(timeout=30000) as download_info:
-                    page.click("#generate-btn")
-                    download = download_info.value
-
-                # ダウンロードしたファイルを保存
-                download.save_as(str(output_pdf))
-
-                browser.close()
-
-            assert output_pdf.exists(), "PDF not generated"
-            assert output_pdf.stat().st_size > 0, "PDF file is empty"
-
-        finally:
-            server_process.terminate()
-            try:
-                server_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                server_process.kill()
+        assert output_pdf.stat().st_size > 0, "PDF file is empty"
 
 
 class TestPDFConsistency:
@@ -474,114 +658,23 @@ class TestPDFConsistency:
         not (HAS_REQUESTS and HAS_PLAYWRIGHT),
         reason="Requires requests and Playwright",
     )
-    def test_all_interfaces_consistency(self, test_csv_data, output_dir, test_server_port):
+    @uses_servers
+    def test_all_interfaces_consistency(
+        self, test_csv_data, output_dir, cli_pdf, web_pdf, http_server, browser_page
+    ):
         """3つすべてのインターフェースで生成されたPDFの一貫性テスト
 
         このテストはrequestsとPlaywrightが必要です。
         """
-        from playwright.sync_api import sync_playwright
-
-        pdfs = {}
-
-        # 1. CLI版でPDF生成
-        cli_pdf = output_dir / "consistency_test_cli.pdf"
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "letterpack.cli",
-                "--csv",
-                str(test_csv_data),
-                "--output",
-                str(cli_pdf),
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, f"CLI failed: {result.stderr}"
-        assert cli_pdf.exists()
-        pdfs["cli"] = cli_pdf
-
-        # 2. Webサーバー版でPDF生成
-        web_pdf = output_dir / "consistency_test_web.pdf"
-        server_process = subprocess.Popen(
-            ["python", "-m", "letterpack.web"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        try:
-            time.sleep(2)  # サーバー起動待機
-
-            with open(test_csv_data, "rb") as f:
-                files = {"csv_file": f}
-                response = requests.post(
-                    f"http://localhost:{test_server_port}/generate",
-                    files=files,
-                    timeout=10,
-                )
-
-            assert response.status_code == 200, f"Web API failed: {response.status_code}"
-            web_pdf.write_bytes(response.content)
-            assert web_pdf.exists()
-            pdfs["web"] = web_pdf
-
-        finally:
-            server_process.terminate()
-            try:
-                server_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                server_process.kill()
-
-        # 3. 静的HTML版でPDF生成
-        static_pdf = output_dir / "consistency_test_static.pdf"
-        http_server = subprocess.Popen(
-            ["python", "-m", "http.server", "8888"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        try:
-            time.sleep(2)  # サーバー起動待機
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                page.goto("http://localhost:8888/index_static.html")
-                page.wait_for_selector("#label-form", timeout=90000)
-
-                # CSVデータの1行目を使用
-                with open(test_csv_data, encoding="utf-8") as f:
-                    lines = f.readlines()
-                    if len(lines) > 1:
-                        data_line = lines[1].strip().split(",")
-                        if len(data_line) >= 10:
-                            page.fill("#to_postal", data_line[0])
-                            page.fill("#to_address1", data_line[1])
-                            page.fill("#to_name", data_line[2])
-                            page.fill("#to_phone", data_line[3])
-                            page.fill("#from_postal", data_line[5])
-                            page.fill("#from_address1", data_line[6])
-                            page.fill("#from_name", data_line[7])
-                            page.fill("#from_phone", data_line[8])
-
-                with page.expect_download(timeout=30000) as download_info:
-                    page.click("#generate-btn")
-                    download = download_info.value
-
-                download.save_as(str(static_pdf))
-                browser.close()
-
-            assert static_pdf.exists()
-            pdfs["static"] = static_pdf
-
-        finally:
-            http_server.terminate()
-            try:
-                http_server.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                http_server.kill()
+        # 1〜3. CLI版・Webサーバー版・静的HTML版でPDF生成
+        # CLI版とWebサーバー版は他のテストと共有するフィクスチャで生成済みのPDFを使う
+        pdfs = {
+            "cli": cli_pdf.path,
+            "web": web_pdf,
+            "static": _generate_pdf_with_static_html(
+                browser_page, test_csv_data, output_dir / "consistency_test_static.pdf", http_server
+            ),
+        }
 
         # 4. ページ数の比較
         page_counts = {}
@@ -604,48 +697,22 @@ class TestPDFConsistency:
                 for keyword in expected_keywords:
                     assert keyword in text, f"{name}: Missing keyword '{keyword}'"
 
-    def test_cli_generates_valid_pdf(self, test_csv_data, output_dir):
+    @pytest.mark.skipif(not HAS_PDFPLUMBER, reason="pdfplumber not installed")
+    def test_cli_generates_valid_pdf(self, cli_pdf):
         """CLI版がページ数と内容の点で有効なPDFを生成するか確認"""
-        output_pdf = output_dir / "consistency_cli.pdf"
-
-        # CLI版でPDF生成
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "letterpack.cli",
-                "--csv",
-                str(test_csv_data),
-                "--output",
-                str(output_pdf),
-            ],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert output_pdf.exists()
-
         # PDF構造の確認
-        file_size = PDFValidator.get_file_size(str(output_pdf))
-        assert file_size > 1000, "PDF file seems too small"
-
-        page_count = PDFValidator.get_page_count(str(output_pdf))
-        if page_count is not None:
-            assert page_count >= 1, "PDF has no pages"
+        assert cli_pdf.size > 1000, "PDF file seems too small"
+        assert cli_pdf.pages >= 1, "PDF has no pages"
 
         # テキスト内容の確認（キーワードが含まれているか）
-        text_content = PDFValidator.extract_text(str(output_pdf))
-        if text_content is not None:
-            # テキストが抽出できた場合のみ検証
-            if text_content.strip():
-                # 宛先情報が含まれているか確認（複数のキーワードで検証）
-                assert any(keyword in text_content for keyword in ["山田太郎", "山田", "太郎"]), (
-                    "PDF does not contain recipient information"
-                )
-            else:
-                # テキスト抽出は成功したが内容が空の場合はスキップ
-                pytest.skip("Text extraction succeeded but returned empty content")
+        text_content = cli_pdf.text
+        if not text_content.strip():
+            # テキスト抽出は成功したが内容が空の場合はスキップ
+            pytest.skip("Text extraction succeeded but returned empty content")
+        # 宛先情報が含まれているか確認（複数のキーワードで検証）
+        assert any(keyword in text_content for keyword in ["山田太郎", "山田", "太郎"]), (
+            "PDF does not contain recipient information"
+        )
 
     def test_csv_parsing_and_batch_generation(self, test_csv_data, output_dir):
         """CSV解析とバッチPDF生成のテスト"""
@@ -660,8 +727,8 @@ class TestPDFConsistency:
 
         # バッチでPDF生成
         result = create_label_batch(label_pairs, str(output_pdf))
-        assert os.path.exists(result)
-        assert os.path.getsize(result) > 0
+        # 存在確認とサイズ確認を1回のstatで行う（存在しなければFileNotFoundErrorで失敗する）
+        assert os.stat(result).st_size > 0
 
     def test_single_label_consistency(self, output_dir):
         """単一ラベルの生成一貫性テスト"""
@@ -683,18 +750,13 @@ class TestPDFConsistency:
         pdfs = []
         for i in range(2):
             pdf_path = output_dir / f"single_label_iteration_{i}.pdf"
-            from letterpack.label import create_label
-
             create_label(to_addr, from_addr, str(pdf_path))
             pdfs.append(pdf_path)
 
-        # 両方のPDFが存在することを確認
-        for pdf_path in pdfs:
-            assert pdf_path.exists(), f"PDF not generated: {pdf_path}"
+        # 各PDFのサイズとページ数を1回ずつ取得（存在しなければstatで失敗する）
+        (size1, page_count1), (size2, page_count2) = (_pdf_meta(pdf_path) for pdf_path in pdfs)
 
         # ファイルサイズを比較（フォント環境によって異なる可能性あり）
-        size1 = PDFValidator.get_file_size(str(pdfs[0]))
-        size2 = PDFValidator.get_file_size(str(pdfs[1]))
         # ファイルサイズが同じか、または非常に近い（許容値：5%）
         # フォント埋め込みやメタデータなどの環境依存要素によるばらつきを考慮
         # 同じデータから生成されたPDFは基本的に同じサイズになるはずだが、
@@ -705,13 +767,8 @@ class TestPDFConsistency:
         )
 
         # ページ数が同じか確認
-        if HAS_PYPDF2:
-            page_count1 = PDFValidator.get_page_count(str(pdfs[0]))
-            page_count2 = PDFValidator.get_page_count(str(pdfs[1]))
-            if page_count1 is not None and page_count2 is not None:
-                assert page_count1 == page_count2, (
-                    f"Page counts differ: {page_count1} vs {page_count2}"
-                )
+        if page_count1 is not None and page_count2 is not None:
+            assert page_count1 == page_count2, f"Page counts differ: {page_count1} vs {page_count2}"
 
     @pytest.mark.skipif(not HAS_PDFPLUMBER, reason="pdfplumber not installed")
     def test_detailed_text_comparison(self, test_csv_data, output_dir):
@@ -722,23 +779,7 @@ class TestPDFConsistency:
         # 同じCSVから2つのPDFを生成
         pdf1 = output_dir / "text_compare_1.pdf"
         pdf2 = output_dir / "text_compare_2.pdf"
-
-        for pdf_path in [pdf1, pdf2]:
-            result = subprocess.run(
-                [
-                    "python",
-                    "-m",
-                    "letterpack.cli",
-                    "--csv",
-                    str(test_csv_data),
-                    "--output",
-                    str(pdf_path),
-                ],
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == 0
-            assert pdf_path.exists()
+        _generate_pdf_pair(test_csv_data, pdf1, pdf2)
 
         # テキスト内容を詳細比較
         comparison = PDFValidator.compare_text_content(str(pdf1), str(pdf2))
@@ -770,23 +811,7 @@ class TestPDFConsistency:
         # 同じCSVから2つのPDFを生成
         pdf1 = output_dir / "layout_compare_1.pdf"
         pdf2 = output_dir / "layout_compare_2.pdf"
-
-        for pdf_path in [pdf1, pdf2]:
-            result = subprocess.run(
-                [
-                    "python",
-                    "-m",
-                    "letterpack.cli",
-                    "--csv",
-                    str(test_csv_data),
-                    "--output",
-                    str(pdf_path),
-                ],
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == 0
-            assert pdf_path.exists()
+        _generate_pdf_pair(test_csv_data, pdf1, pdf2)
 
         # 位置情報を抽出
         pos1 = PDFValidator.extract_layout_positions(str(pdf1))
@@ -818,39 +843,17 @@ class TestPDFConsistency:
 class TestMultiInterfaceReport:
     """複数インターフェースのテスト結果レポート生成"""
 
-    def test_generate_test_report(self, test_csv_data, output_dir, capsys):
+    def test_generate_test_report(self, cli_pdf):
         """テスト結果レポートを生成"""
-        output_pdf = output_dir / "report.pdf"
-
-        # CLI版でPDF生成
-        start_time = time.time()
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "letterpack.cli",
-                "--csv",
-                str(test_csv_data),
-                "--output",
-                str(output_pdf),
-            ],
-            capture_output=True,
-            text=True,
-        )
-        cli_time = time.time() - start_time
-
-        assert result.returncode == 0
-
-        # レポート情報を取得
-        file_size = PDFValidator.get_file_size(str(output_pdf))
-        page_count = PDFValidator.get_page_count(str(output_pdf))
+        # CLI版の生成結果（生成に失敗した場合はフィクスチャの時点でエラーになる）
+        page_count = cli_pdf.pages
 
         # レポートを生成
         report = {
             "cli": {
-                "status": "success" if result.returncode == 0 else "failed",
-                "execution_time": f"{cli_time:.2f}s",
-                "file_size": file_size,
+                "status": "success",
+                "execution_time": f"{cli_pdf.seconds:.2f}s",
+                "file_size": cli_pdf.size,
                 "page_count": page_count,
             },
         }
@@ -861,7 +864,6 @@ class TestMultiInterfaceReport:
         if page_count is not None:
             assert report["cli"]["page_count"] >= 1
 
-    @pytest.mark.skipif(not HAS_PSUTIL, reason="psutil not installed")
     def test_performance_comparison(self, test_csv_data, output_dir):
         """3つのインターフェースのパフォーマンス比較テスト
 
@@ -871,27 +873,18 @@ class TestMultiInterfaceReport:
 
         # CLI版のパフォーマンス測定
         output_pdf = output_dir / "perf_cli.pdf"
-        start_time = time.time()
-        start_memory = psutil.Process().memory_info().rss
-
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "letterpack.cli",
-                "--csv",
-                str(test_csv_data),
-                "--output",
-                str(output_pdf),
-            ],
-            capture_output=True,
-            text=True,
-        )
-
-        cli_time = time.time() - start_time
-        cli_memory = psutil.Process().memory_info().rss - start_memory
+        # CLIはプロセス内で実行するため、RSSの差分ではなくtracemallocのピークで
+        # この呼び出しが確保したメモリだけを計測する
+        tracemalloc.start()
+        try:
+            start_time = time.perf_counter()
+            returncode = cli_main(["--csv", str(test_csv_data), "--output", str(output_pdf)])
+            cli_time = time.perf_counter() - start_time
+            cli_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
 
-        assert result.returncode == 0, f"CLI failed: {result.stderr}"
+        assert returncode == 0, "CLI failed"
 
         results["cli"] = {
             "time_seconds": round(cli_time, 3),
@@ -7,32 +7,28 @@ Tests for Performance Metrics
 from __future__ import annotations
 
 import json
-import sys
 from pathlib import Path
 
 import pytest
 
-# tools/performance_metrics.pyをインポートできるようにパスを追加
-sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
-
 from performance_metrics import PerformanceComparison, PerformanceMetrics, PerformanceMonitor
 
 # このファイルの全テストにdeployment_verificationマーカーを適用
 pytestmark = pytest.mark.deployment_verification
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def performance_monitor():
-    """パフォーマンスモニターのフィクスチャ"""
+    """パフォーマンスモニターのフィクスチャ（読み取り専用のためセッション内で共有する）"""
     config_path = (
         Path(__file__).parent.parent / ".claude/skills/deployment-verification/config.yaml"
     )
     return PerformanceMonitor(config_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metrics():
-    """サンプルメトリクスのフィクスチャ"""
+    """サンプルメトリクスのフィクスチャ（読み取り専用のためセッション内で共有する）"""
     return PerformanceMetrics(
         target="github-pages",
         timestamp="2025-01-01T00:00:00",
@@ -44,9 +40,9 @@ def sample_metrics():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def baseline_metrics():
-    """ベースラインメトリクスのフィクスチャ"""
+    """ベースラインメトリクスのフィクスチャ（読み取り専用のためセッション内で共有する）"""
     return PerformanceMetrics(
         target="github-pages",
         timestamp="2024-12-01T00:00:00",
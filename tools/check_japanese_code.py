@@ -9,38 +9,73 @@
 3. docstringの充実度
 """
 
+import contextlib
+import os
 import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# チェック対象の拡張子（Python・Markdown・HTML）
+TARGET_SUFFIXES = {".py", ".md", ".html"}
+# パスにこれらの文字列を含むディレクトリ・ファイルは除外する
+EXCLUDED_PATH_PARTS = (".git", "node_modules", ".venv", "__pycache__", "uv.lock")
+# この数以上のファイルをチェックするときだけプロセスを分けて並列に実行する
+PARALLEL_MIN_FILES = 128
 
-def check_encoding(file_path: Path) -> tuple[str, bool]:
-    """ファイルのエンコーディングをチェック"""
+# 全角数字・全角英字のパターン
+FULLWIDTH_NUMBER_PATTERN = re.compile(r"[０-９]+")
+FULLWIDTH_ALPHA_PATTERN = re.compile(r"[Ａ-Ｚａ-ｚ]+")
+# 全角数字・全角英字のいずれかを含む行を探すためのパターン（ファイル全体に対して使う）
+FULLWIDTH_CHAR_PATTERN = re.compile(r"[０-９Ａ-Ｚａ-ｚ]")
+
+FULLWIDTH_NUMBER_TABLE = str.maketrans("０１２３４５６７８９", "0123456789")
+FULLWIDTH_ALPHA_TABLE = str.maketrans(
+    "ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ",
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+)
+
+# docstringチェックで使う関数・クラス定義のパターン
+FUNCTION_PATTERN = re.compile(r"^def\s+(\w+)\s*\(", re.MULTILINE)
+CLASS_PATTERN = re.compile(r"^class\s+(\w+)", re.MULTILINE)
+
+
+def detect_encoding(data: bytes) -> tuple[str, bool]:
+    """バイト列のエンコーディングを判定
+
+    Args:
+        data: ファイルの内容
+
+    Returns:
+        (エンコーディング名, UTF-8かどうか)
+    """
     try:
-        with open(file_path, encoding="utf-8") as f:
-            f.read()
+        data.decode("utf-8")
         return "UTF-8", True
     except UnicodeDecodeError:
-        # その他のエンコーディングを試す
+        # その他のエンコーディングを試す（ファイルを開き直さず、読み込み済みのバイト列で判定する）
         for encoding in ["shift_jis", "euc_jp", "iso2022_jp"]:
             try:
-                with open(file_path, encoding=encoding) as f:
-                    f.read()
+                data.decode(encoding)
                 return encoding, False
             except UnicodeDecodeError:
                 continue
         return "Unknown", False
 
 
+def check_encoding(file_path: Path) -> tuple[str, bool]:
+    """ファイルのエンコーディングをチェック"""
+    return detect_encoding(file_path.read_bytes())
+
+
 def check_fullwidth_numbers(text: str, file_path: str, line_num: int) -> list[dict]:
     """全角数字をチェック"""
     issues = []
-    # 全角数字パターン（０-９）
-    fullwidth_pattern = re.compile(r"[０-９]+")
 
-    for match in fullwidth_pattern.finditer(text):
+    for match in FULLWIDTH_NUMBER_PATTERN.finditer(text):
         # コメント内かコード内かは区別しない（すべて検出）
-        halfwidth = match.group().translate(str.maketrans("０１２３４５６７８９", "0123456789"))
+        halfwidth = match.group().translate(FULLWIDTH_NUMBER_TABLE)
         issues.append(
             {
                 "file": file_path,
@@ -57,16 +92,9 @@ def check_fullwidth_numbers(text: str, file_path: str, line_num: int) -> list[di
 def check_fullwidth_alpha(text: str, file_path: str, line_num: int) -> list[dict]:
     """全角英字をチェック"""
     issues = []
-    # 全角英字パターン
-    fullwidth_pattern = re.compile(r"[Ａ-Ｚａ-ｚ]+")
-
-    for match in fullwidth_pattern.finditer(text):
-        halfwidth = match.group().translate(
-            str.maketrans(
-                "ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ",
-                "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
-            )
-        )
+
+    for match in FULLWIDTH_ALPHA_PATTERN.finditer(text):
+        halfwidth = match.group().translate(FULLWIDTH_ALPHA_TABLE)
         issues.append(
             {
                 "file": file_path,
@@ -80,22 +108,68 @@ def check_fullwidth_alpha(text: str, file_path: str, line_num: int) -> list[dict
     return issues
 
 
-def check_docstrings(file_path: Path) -> list[dict]:
-    """docstringの有無をチェック"""
+def check_fullwidth(content: str, file_path: str) -> list[dict]:
+    """ファイル全体から全角数字・全角英字をチェック
+
+    1行ずつ走査せず、ファイル全体に対して正規表現で全角文字を含む行だけを探し、
+    その行に対して check_fullwidth_numbers / check_fullwidth_alpha を実行する。
+
+    Args:
+        content: ファイルの内容
+        file_path: レポートに表示するファイルパス
+
+    Returns:
+        検出した問題のリスト
+    """
     issues = []
+    line_num = 1
+    line_start = 0
+    pos = 0
 
-    try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-    except (OSError, UnicodeDecodeError):
-        return issues
+    while match := FULLWIDTH_CHAR_PATTERN.search(content, pos):
+        # 行番号は前回の行頭からの改行数を数えて進める（ファイル全体で1回の走査になる）
+        prev_line_start = line_start
+        line_start = content.rfind("\n", pos, match.start()) + 1 or pos
+        line_num += content.count("\n", prev_line_start, line_start)
+        line_end = content.find("\n", match.start()) + 1 or len(content)
+        line = content[line_start:line_end]
 
-    # 関数定義を検索
-    function_pattern = re.compile(r"^def\s+(\w+)\s*\(", re.MULTILINE)
-    class_pattern = re.compile(r"^class\s+(\w+)", re.MULTILINE)
+        # コメントと文字列リテラルから日本語テキストを抽出
+        if "#" in line or '"' in line or "'" in line:
+            issues.extend(check_fullwidth_numbers(line, file_path, line_num))
+            issues.extend(check_fullwidth_alpha(line, file_path, line_num))
+
+        pos = line_end
+
+    return issues
+
+
+def check_docstrings(file_path: Path, content: str | None = None) -> list[dict]:
+    """docstringの有無をチェック
+
+    Args:
+        file_path: チェック対象のファイルパス
+        content: 読み込み済みのファイルの内容（省略時はファイルから読み込む）
+
+    Returns:
+        検出した問題のリスト
+    """
+    issues = []
+
+    if content is None:
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            return issues
+
+    # 行番号はマッチ位置の昇順に、前回の位置からの改行数を数えて進める
+    # （マッチごとに先頭から数え直すとファイルサイズ×マッチ数の計算量になるため）
+    line_num = 1
+    counted = 0
 
     # 関数をチェック
-    for match in function_pattern.finditer(content):
+    for match in FUNCTION_PATTERN.finditer(content):
         func_name = match.group(1)
         # プライベート関数とマジックメソッドは除外
         if not func_name.startswith("_"):
@@ -105,7 +179,8 @@ def check_docstrings(file_path: Path) -> list[dict]:
 
             if '"""' not in next_200 and "'''" not in next_200:
                 # 行番号を計算
-                line_num = content[: match.start()].count("\n") + 1
+                line_num += content.count("\n", counted, match.start())
+                counted = match.start()
                 issues.append(
                     {
                         "file": str(file_path),
@@ -115,8 +190,10 @@ def check_docstrings(file_path: Path) -> list[dict]:
                     }
                 )
 
-    # クラスをチェック
-    for match in class_pattern.finditer(content):
+    # クラスをチェック（行番号はファイル先頭から数え直す）
+    line_num = 1
+    counted = 0
+    for match in CLASS_PATTERN.finditer(content):
         class_name = match.group(1)
         # プライベートクラスは除外
         if not class_name.startswith("_"):
@@ -124,7 +201,8 @@ def check_docstrings(file_path: Path) -> list[dict]:
             next_300 = content[search_start : search_start + 500]
 
             if '"""' not in next_300 and "'''" not in next_300:
-                line_num = content[: match.start()].count("\n") + 1
+                line_num += content.count("\n", counted, match.start())
+                counted = match.start()
                 issues.append(
                     {
                         "file": str(file_path),
@@ -204,62 +282,74 @@ def generate_report(
     print("\n" + "=" * 60 + "\n")
 
 
-def main():
-    """メイン処理"""
-    # チェック対象のファイルパターン
-    patterns = [
-        ("*.py", "Pythonファイル"),
-        ("*.md", "Markdownファイル"),
-        ("*.html", "HTMLファイル"),
-    ]
+def iter_target_files(project_root: Path) -> Iterator[Path]:
+    """チェック対象のファイルを1回のディレクトリ走査で列挙
 
-    encoding_issues = []
-    fullwidth_issues = []
-    docstring_issues = []
-
-    # 1. エンコーディングチェック
-    print("\n🔍 チェック中...\n")
-    print("  - 文字コーディングをチェック中...")
-
-    project_root = Path(".")
-    for pattern, _ in patterns:
-        for file_path in project_root.rglob(pattern):
-            # 除外ファイル
-            if any(
-                x in str(file_path)
-                for x in [".git", "node_modules", ".venv", "__pycache__", "uv.lock"]
-            ):
+    除外ディレクトリ（.venvなど）には降りずに枝刈りする。
+    """
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = [d for d in dirnames if not any(x in d for x in EXCLUDED_PATH_PARTS)]
+        for filename in filenames:
+            if os.path.splitext(filename)[1] not in TARGET_SUFFIXES:
+                continue
+            if any(x in filename for x in EXCLUDED_PATH_PARTS):
                 continue
+            yield Path(dirpath, filename)
 
-            encoding, is_utf8 = check_encoding(file_path)
-            if not is_utf8:
-                encoding_issues.append((file_path, encoding))
 
-    # 2. Pythonファイルの全角・半角チェック
-    print("  - 全角・半角をチェック中...")
-    for file_path in project_root.rglob("*.py"):
-        if any(x in str(file_path) for x in [".git", "node_modules", ".venv", "__pycache__"]):
-            continue
+def analyze_file(file_path: Path) -> tuple[tuple[Path, str] | None, list[dict], list[dict]]:
+    """1ファイル分のチェックをまとめて実行
 
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                for i, line in enumerate(f, 1):
-                    # コメントと文字列リテラルから日本語テキストを抽出
-                    if "#" in line or '"' in line or "'" in line:
-                        fullwidth_issues.extend(check_fullwidth_numbers(line, str(file_path), i))
-                        fullwidth_issues.extend(check_fullwidth_alpha(line, str(file_path), i))
-        except (OSError, UnicodeDecodeError):
-            pass
+    Args:
+        file_path: チェック対象のファイルパス
+
+    Returns:
+        (エンコーディングの問題（なければNone）, 全角・半角の問題, docstringの問題)
+    """
+    # ファイルは1回だけ読み込み、すべてのチェックで同じ内容を使う
+    data = file_path.read_bytes()
+    encoding, is_utf8 = detect_encoding(data)
+    if not is_utf8:
+        return (file_path, encoding), [], []
+    if file_path.suffix != ".py":
+        return None, [], []
 
-    # 3. Pythonファイルのdocstringチェック
-    print("  - docstringをチェック中...")
-    for file_path in project_root.rglob("*.py"):
-        if any(
-            x in str(file_path) for x in [".git", "node_modules", ".venv", "__pycache__", "tests"]
-        ):
-            continue
+    # テキストモードで読み込んだ場合と同じく、改行コードを\nに揃える
+    content = data.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    fullwidth_issues = check_fullwidth(content, str(file_path))
 
-        docstring_issues.extend(check_docstrings(file_path))
+    # テストコードはdocstringチェックの対象外
+    is_test = "tests" in str(file_path)
+    docstring_issues = [] if is_test else check_docstrings(file_path, content)
+    return None, fullwidth_issues, docstring_issues
+
+
+def main():
+    """メイン処理"""
+    encoding_issues = []
+    fullwidth_issues = []
+    docstring_issues = []
+
+    print("\n🔍 チェック中...\n")
+    print("  - 文字コーディング・全角・半角・docstringをチェック中...")
+
+    files = list(iter_target_files(Path(".")))
+    with contextlib.ExitStack() as stack:
+        if len(files) >= PARALLEL_MIN_FILES:
+            # ファイルごとのチェックは互いに独立なので、プロセスを分けて並列に実行する
+            executor = stack.enter_context(ProcessPoolExecutor())
+            results = executor.map(analyze_file, files, chunksize=32)
+        else:
+            # ファイル数が少ないとプロセス起動のコストの方が大きいため、そのまま実行する
+            results = map(analyze_file, files)
+
+        for encoding_issue, fullwidth, docstrings in results:
+            if encoding_issue is not None:
+                encoding_issues.append(encoding_issue)
+            fullwidth_issues.extend(fullwidth)
+            docstring_issues.extend(docstrings)
 
     # レポート生成
     generate_report(encoding_issues, fullwidth_issues, docstring_issues)
@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import copy
+import functools
 import sys
 import time
 from dataclasses import dataclass, field
@@ -38,6 +40,26 @@ except ImportError:
     BeautifulSoup = None
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config(config_path: str, mtime_ns: int) -> dict[str, Any]:
+    """設定ファイルを読み込む
+
+    パスと更新時刻をキーにキャッシュし、同じ設定ファイルを何度もパースしないようにする。
+    呼び出し側はインスタンス間で共有しないようコピーして使うこと。
+
+    Args:
+        config_path: 設定ファイルのパス
+        mtime_ns: 設定ファイルの更新時刻（ファイル変更時にキャッシュを無効化するため）
+
+    Returns:
+        設定内容
+    """
+    # libyamlが利用可能ならC実装のローダーを使い、なければ純Python実装にフォールバックする
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
+
+
 @dataclass
 class LinkCheckResult:
     """リンクチェックの結果"""
@@ -105,8 +127,9 @@ class DeploymentVerifier:
             config_path = Path(config_path)
 
         if config_path.exists():
-            with open(config_path, encoding="utf-8") as f:
-                self.config = yaml.safe_load(f)
+            self.config = copy.deepcopy(
+                _load_config(str(config_path), config_path.stat().st_mtime_ns)
+            )
         else:
             print(f"Warning: Config file not found at {config_path}, using defaults")
             self.config = self._get_default_config()
@@ -419,6 +442,16 @@ class GitHubPagesVerifier(DeploymentVerifier):
 class DockerVerifier(DeploymentVerifier):
     """Docker環境検証クラス"""
 
+    def __init__(self, config_path: str | Path | None = None, client: Any | None = None):
+        """初期化
+
+        Args:
+            config_path: 設定ファイルのパス。Noneの場合はデフォルト設定を使用
+            client: 接続済みのDockerクライアント。Noneの場合はverify()ごとに接続する
+        """
+        super().__init__(config_path)
+        self.client = client
+
     def verify(self, build_image: bool = True) -> DockerVerificationResult:
         """Docker環境を検証
 
@@ -442,7 +475,8 @@ class DockerVerifier(DeploymentVerifier):
         config = self.config.get("docker", {})
 
         try:
-            client = docker.from_env()
+            # 注入されたクライアントがあれば再接続しない
+            client = self.client if self.client is not None else docker.from_env()
             self._log("✅ Connected to Docker daemon")
         except docker.errors.DockerException as e:
             self._log(f"❌ Docker daemon error: {e}", "ERROR")
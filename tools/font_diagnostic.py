@@ -11,6 +11,8 @@
 
 import os
 import sys
+from collections.abc import Iterator
+from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import Any
 
@@ -55,10 +57,49 @@ def get_platform_font_dirs() -> list[str]:
         ]
 
 
-def find_system_fonts() -> dict[str, list[str]]:
+# 検索対象のフォントファイル拡張子（小文字）
+FONT_EXTENSIONS = (".ttf", ".ttc")
+
+
+def _iter_font_files(font_dir: str) -> Iterator[str]:
+    """
+    フォントディレクトリ配下のフォントファイルを列挙
+
+    os.scandirによるスタックベースの深さ優先探索で走査し、
+    拡張子が一致しないファイルはstatせずに除外する
+
+    Args:
+        font_dir: 探索を開始するディレクトリ
+
+    Yields:
+        str: フォントファイルのパス
+
+    Raises:
+        PermissionError, OSError: font_dir自体を読み取れない場合
+    """
+    stack = [font_dir]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(FONT_EXTENSIONS):
+                        yield entry.path
+        except OSError:
+            # サブディレクトリの読み取りエラーはスキップ（rglobと同じ挙動）
+            if current == font_dir:
+                raise
+
+
+def find_system_fonts(font_dirs: list[str] | None = None) -> dict[str, list[str]]:
     """
     システムにインストールされているフォントを検索
 
+    Args:
+        font_dirs: 検索するディレクトリ（Noneの場合はプラットフォームのフォントディレクトリ）
+
     Returns:
         dict[str, list[str]]: 見つかったフォント情報
     """
@@ -71,38 +112,39 @@ def find_system_fonts() -> dict[str, list[str]]:
         "other_cjk": [],
     }
 
-    font_dirs = get_platform_font_dirs()
+    if font_dirs is None:
+        font_dirs = get_platform_font_dirs()
 
     for font_dir in font_dirs:
         if not Path(font_dir).exists():
             continue
 
         try:
-            # Noto CJKフォント
-            noto_cjk = list(Path(font_dir).rglob("*Noto*CJK*.ttc")) + list(
-                Path(font_dir).rglob("*Noto*CJK*.ttf")
-            )
-            fonts["noto_cjk"].extend([str(f) for f in noto_cjk])
-
-            # Noto Sans フォント
-            noto_sans = list(Path(font_dir).rglob("*Noto*Sans*.ttf")) + list(
-                Path(font_dir).rglob("*Noto*Sans*.ttc")
-            )
-            fonts["noto_sans"].extend([str(f) for f in noto_sans if "CJK" not in str(f)])
-
-            # IPAフォント
-            ipa_files = list(Path(font_dir).rglob("*ipa*.ttf")) + list(
-                Path(font_dir).rglob("*ipa*.ttc")
-            )
-            for f in ipa_files:
-                if "gothic" in str(f).lower() or "ipag" in str(f).lower():
-                    fonts["ipa_gothic"].append(str(f))
-                elif "serif" in str(f).lower() or "ipam" in str(f).lower():
-                    fonts["ipa_serif"].append(str(f))
-
-            # Heiseiフォント
-            heiseifonts = list(Path(font_dir).rglob("*Heisei*.ttf"))
-            fonts["heiseifonts"].extend([str(f) for f in heiseifonts])
+            # ディレクトリを1回だけ走査し、ファイル名で分類する
+            for path in _iter_font_files(font_dir):
+                name = os.path.basename(path)
+                lower_path = path.lower()
+
+                # Noto CJKフォント
+                if fnmatchcase(name, "*Noto*CJK*.ttc") or fnmatchcase(name, "*Noto*CJK*.ttf"):
+                    fonts["noto_cjk"].append(path)
+
+                # Noto Sans フォント
+                if (
+                    fnmatchcase(name, "*Noto*Sans*.ttf") or fnmatchcase(name, "*Noto*Sans*.ttc")
+                ) and "CJK" not in path:
+                    fonts["noto_sans"].append(path)
+
+                # IPAフォント
+                if fnmatchcase(name, "*ipa*.ttf") or fnmatchcase(name, "*ipa*.ttc"):
+                    if "gothic" in lower_path or "ipag" in lower_path:
+                        fonts["ipa_gothic"].append(path)
+                    elif "serif" in lower_path or "ipam" in lower_path:
+                        fonts["ipa_serif"].append(path)
+
+                # Heiseiフォント
+                if fnmatchcase(name, "*Heisei*.ttf"):
+                    fonts["heiseifonts"].append(path)
 
         except (PermissionError, OSError):
             continue
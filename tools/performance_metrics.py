@@ -11,6 +11,8 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import copy
+import functools
 import json
 import sys
 import time
@@ -34,6 +36,26 @@ except ImportError:
     psutil = None
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config(config_path: str, mtime_ns: int) -> dict[str, Any]:
+    """設定ファイルを読み込む
+
+    パスと更新時刻をキーにキャッシュし、同じ設定ファイルを何度もパースしないようにする。
+    呼び出し側はインスタンス間で共有しないようコピーして使うこと。
+
+    Args:
+        config_path: 設定ファイルのパス
+        mtime_ns: 設定ファイルの更新時刻（ファイル変更時にキャッシュを無効化するため）
+
+    Returns:
+        設定内容
+    """
+    # libyamlが利用可能ならC実装のローダーを使い、なければ純Python実装にフォールバックする
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
+
+
 @dataclass
 class PerformanceMetrics:
     """パフォーマンスメトリクス"""
@@ -81,8 +103,9 @@ class PerformanceMonitor:
             config_path = Path(config_path)
 
         if config_path.exists():
-            with open(config_path, encoding="utf-8") as f:
-                self.config = yaml.safe_load(f)
+            self.config = copy.deepcopy(
+                _load_config(str(config_path), config_path.stat().st_mtime_ns)
+            )
         else:
             print(f"Warning: Config file not found at {config_path}, using defaults")
             self.config = {}